@@ -1,36 +1,129 @@
+from __future__ import annotations
+
+import sys
+import weakref
+from typing import Dict, Optional, Tuple, Type, final
+
+# fmt: off
+__all__ = (
+    'BasicEmoji',
+)
+# fmt: on
+
+
 class BasicEmoji:
     """Represnts a "basic" discord emoji.
     A basic emoji is either a unicode emoji or a custom emoji uploaded to the guild.
-    
-    Attributes
-    -----------
-    name: Optional[:class:`str`]
-        The custom emoji name, if applicable, or the unicode codepoint
-        of the non-custom emoji.
     """
-    
+
+    __slots__ = ('_name', '_hash', '_repr', '_is_custom_emoji', '__weakref__')
+
+    def __new__(cls, name: str, is_custom_emoji: bool = False) -> BasicEmoji:
+        # Emojis made through BasicEmoji itself get one of the final concrete types below,
+        # which keeps the exact type check in __eq__ valid. Subclasses are built as they are.
+        emoji_cls: Type[BasicEmoji] = cls
+        if cls is BasicEmoji:
+            emoji_cls = _CustomBasicEmoji if is_custom_emoji else _UnicodeBasicEmoji
+        return object.__new__(emoji_cls)
+
     def __init__(self, name: str, is_custom_emoji: bool = False):
-        self.name = name
-        self.is_custom_emoji: bool = is_custom_emoji
-        
+        # only exact strings can be interned, subclasses and None are kept as given
+        self._name: str = sys.intern(name) if type(name) is str else name
+        self._hash: int = hash(self._name)
+        self._repr: Optional[str] = None
+        self._is_custom_emoji: bool = is_custom_emoji
+
+    @property
+    def name(self) -> str:
+        """Optional[:class:`str`]: The custom emoji name, if applicable, or the unicode codepoint
+        of the non-custom emoji.
+
+        This is read-only since the hash is derived from it.
+        """
+        return self._name
+
+    @property
+    def is_custom_emoji(self) -> bool:
+        """:class:`bool`: Whether this is a custom emoji uploaded to a guild."""
+        return self._is_custom_emoji
+
+    @property
+    def is_unicode_emoji(self) -> bool:
+        """:class:`bool`: Whether this is a Unicode emoji."""
+        return not self._is_custom_emoji
+
+    @classmethod
+    def get(cls, name: str, is_custom_emoji: bool = False) -> BasicEmoji:
+        """Returns the shared :class:`BasicEmoji` for the given name, creating it if needed.
+
+        Identical emojis resolve to the same object, which makes comparisons
+        and hashing cheap. Unicode emojis are kept once created while custom
+        emojis are only shared for as long as they are referenced somewhere.
+
+        Parameters
+        -----------
+        name: :class:`str`
+            The custom emoji name or the unicode codepoint of the emoji.
+        is_custom_emoji: :class:`bool`
+            Whether this is a custom emoji uploaded to a guild.
+
+        Returns
+        --------
+        :class:`BasicEmoji`
+            The shared emoji.
+        """
+        # Keyed by class too, so subclasses get instances of their own type
+        key = (cls, name)
+        cache = _custom_emoji_cache if is_custom_emoji else _unicode_emoji_cache
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+
+        emoji = cls(name, is_custom_emoji)
+        if is_custom_emoji or len(cache) < _MAX_UNICODE_EMOJI_CACHE:
+            cache[key] = emoji
+        return emoji
+
+    def __reduce__(self) -> Tuple[Type[BasicEmoji], Tuple[str, bool]]:
+        # __new__ needs the name, and the cached hash must not outlive the process
+        return type(self), (self._name, self.is_custom_emoji)
+
     def __repr__(self) -> str:
-        return f'<{self.__class__.__name__} name={self.name!r}>'
-    
+        # name is read-only, so the cached repr cannot go stale
+        result = self._repr
+        if result is None:
+            result = self._repr = f'<BasicEmoji name={self._name!r}>'
+        return result
+
     def __str__(self) -> str:
-        return self.name
-    
+        return self._name
+
     def __eq__(self, other: object) -> bool:
-        return self.name == other.name if isinstance(other, BasicEmoji) else False
-    
-    def __ne__(self, other: object) -> bool:
-        return not self.__eq__(other)
-    
+        if self is other:
+            return True
+        # Instances are always one of the concrete subclasses, so an exact
+        # type check is enough and lets unrelated types handle the comparison.
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._name is other._name or self._name == other._name
+
     def __hash__(self) -> int:
-        return hash(self.name)
-    
-    @property
-    def is_unicode_emoji(self) -> bool:
-        """:class:`bool`: Checks if this is a Unicode emoji."""
-        return not self.is_custom_emoji
-    
-    
\ No newline at end of file
+        return self._hash
+
+
+@final
+class _UnicodeBasicEmoji(BasicEmoji):
+    __slots__ = ()
+
+
+@final
+class _CustomBasicEmoji(BasicEmoji):
+    __slots__ = ()
+
+
+# Unicode emoji are a closed set so they are kept alive once seen, bounded in
+# case arbitrary strings end up here. Custom emoji come and go with guilds.
+_MAX_UNICODE_EMOJI_CACHE = 4096
+_unicode_emoji_cache: Dict[Tuple[type, str], BasicEmoji] = {}
+_custom_emoji_cache: weakref.WeakValueDictionary[Tuple[type, str], BasicEmoji] = weakref.WeakValueDictionary()
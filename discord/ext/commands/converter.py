@@ -25,13 +25,16 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import datetime
+import functools
 import inspect
 import logging
 import re
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
+    FrozenSet,
     Generic,
     Iterable,
     List,
@@ -54,8 +57,15 @@ import discord
 from .errors import *
 from .errors import BasicEmojiConversionFailure
 
+try:
+    from rapidfuzz.distance import Levenshtein as _Levenshtein  # type: ignore
+except ModuleNotFoundError:
+    _HAS_RAPIDFUZZ = False
+else:
+    _HAS_RAPIDFUZZ = True
+
 if TYPE_CHECKING:
-    from discord.state import Channel
+    from discord.state import Channel, ConnectionState
     from discord.threads import Thread
 
     from .parameters import Parameter
@@ -97,12 +107,25 @@ _log = logging.getLogger(__name__)
 
 
 def _get_from_guilds(bot: _Bot, getter: str, argument: Any) -> Any:
-    result = None
+    method = getattr(discord.Guild, getter)
     for guild in bot.guilds:
-        result = getattr(guild, getter)(argument)
-        if result:
+        result = method(guild, argument)
+        if result is not None:
             return result
-    return result
+    return None
+
+
+def _get_user_named(state: ConnectionState, argument: str) -> Optional[discord.User]:
+    username, _, discriminator = argument.rpartition('#')
+
+    # If # isn't found then "discriminator" actually has the username
+    if not username:
+        discriminator, username = username, discriminator
+
+    if discriminator == '0' or (len(discriminator) == 4 and discriminator.isdigit()):
+        return discord.utils.find(lambda u: u.name == username and u.discriminator == discriminator, state._users.values())
+
+    return state._get_user_named(argument)
 
 
 _utils_get = discord.utils.get
@@ -112,6 +135,19 @@ CT = TypeVar('CT', bound=discord.abc.GuildChannel)
 TT = TypeVar('TT', bound=discord.Thread)
 
 
+def _get_channel_named(guild: discord.Guild, attribute: str, type: Type[CT], name: str) -> Optional[CT]:
+    # Properties like guild.text_channels build and sort a new list on every access,
+    # that order only matters when more than one channel has the requested name.
+    found = None
+    for channel in guild._channels.values():
+        if channel.name == name and isinstance(channel, type):
+            if found is not None:
+                iterable: Iterable[CT] = getattr(guild, attribute)
+                return discord.utils.get(iterable, name=name)
+            found = channel
+    return found
+
+
 @runtime_checkable
 class Converter(Protocol[T_co]):
     """The base class of custom converters that require the :class:`.Context`
@@ -155,12 +191,54 @@ class Converter(Protocol[T_co]):
 
 
 _ID_REGEX = re.compile(r'([0-9]{15,20})$')
+# ID-or-mention patterns; exactly one alternative captures the ID.
+_OBJECT_ARG_RE = re.compile(r'(?:([0-9]{15,20})|<(?:@(?:!|&)?|#)([0-9]{15,20})>)$')
+_USER_ARG_RE = re.compile(r'(?:([0-9]{15,20})|<@!?([0-9]{15,20})>)$')
+_ROLE_ARG_RE = re.compile(r'(?:([0-9]{15,20})|<@&([0-9]{15,20})>)$')
+_EMOJI_ARG_RE = re.compile(r'(?:([0-9]{15,20})|<a?:[a-zA-Z0-9\_]{1,32}:([0-9]{15,20})>)$')
+_KEYCAP_BASES = frozenset('#|0123456789')
+_PARTIAL_EMOJI_RE = re.compile(r'<(a?):([a-zA-Z0-9\_]{1,32}):([0-9]{15,20})>$')
+_UNICODE_EMOJI_RE = re.compile(
+    r'(?:\U0001f1e6[\U0001f1e8-\U0001f1ec\U0001f1ee\U0001f1f1\U0001f1f2\U0001f1f4\U0001f1f6-\U0001f1fa\U0001f1fc\U0001f1fd\U0001f1ff])|(?:\U0001f1e7[\U0001f1e6\U0001f1e7\U0001f1e9-\U0001f1ef\U0001f1f1-\U0001f1f4\U0001f1f6-\U0001f1f9\U0001f1fb\U0001f1fc\U0001f1fe\U0001f1ff])|(?:\U0001f1e8[\U0001f1e6\U0001f1e8\U0001f1e9\U0001f1eb-\U0001f1ee\U0001f1f0-\U0001f1f5\U0001f1f7\U0001f1fa-\U0001f1ff])|(?:\U0001f1e9[\U0001f1ea\U0001f1ec\U0001f1ef\U0001f1f0\U0001f1f2\U0001f1f4\U0001f1ff])|(?:\U0001f1ea[\U0001f1e6\U0001f1e8\U0001f1ea\U0001f1ec\U0001f1ed\U0001f1f7-\U0001f1fa])|(?:\U0001f1eb[\U0001f1ee-\U0001f1f0\U0001f1f2\U0001f1f4\U0001f1f7])|(?:\U0001f1ec[\U0001f1e6\U0001f1e7\U0001f1e9-\U0001f1ee\U0001f1f1-\U0001f1f3\U0001f1f5-\U0001f1fa\U0001f1fc\U0001f1fe])|(?:\U0001f1ed[\U0001f1f0\U0001f1f2\U0001f1f3\U0001f1f7\U0001f1f9\U0001f1fa])|(?:\U0001f1ee[\U0001f1e8-\U0001f1ea\U0001f1f1-\U0001f1f4\U0001f1f6-\U0001f1f9])|(?:\U0001f1ef[\U0001f1ea\U0001f1f2\U0001f1f4\U0001f1f5])|(?:\U0001f1f0[\U0001f1ea\U0001f1ec-\U0001f1ee\U0001f1f2\U0001f1f3\U0001f1f5\U0001f1f7\U0001f1fc\U0001f1fe\U0001f1ff])|(?:\U0001f1f1[\U0001f1e6-\U0001f1e8\U0001f1ee\U0001f1f0\U0001f1f7-\U0001f1fb\U0001f1fe])|(?:\U0001f1f2[\U0001f1e6\U0001f1e8-\U0001f1ed\U0001f1f0-\U0001f1ff])|(?:\U0001f1f3[\U0001f1e6\U0001f1e8\U0001f1ea-\U0001f1ec\U0001f1ee\U0001f1f1\U0001f1f4\U0001f1f5\U0001f1f7\U0001f1fa\U0001f1ff])|\U0001f1f4\U0001f1f2|(?:\U0001f1f4[\U0001f1f2])|(?:\U0001f1f5[\U0001f1e6\U0001f1ea-\U0001f1ed\U0001f1f0-\U0001f1f3\U0001f1f7-\U0001f1f9\U0001f1fc\U0001f1fe])|\U0001f1f6\U0001f1e6|(?:\U0001f1f6[\U0001f1e6])|(?:\U0001f1f7[\U0001f1ea\U0001f1f4\U0001f1f8\U0001f1fa\U0001f1fc])|(?:\U0001f1f8[\U0001f1e6-\U0001f1ea\U0001f1ec-\U0001f1f4\U0001f1f7-\U0001f1f9\U0001f1fb\U0001f1fd-\U0001f1ff])|(?:\U0001f1f9[\U0001f1e6\U0001f1e8\U0001f1e9\U0001f1eb-\U0001f1ed\U0001f1ef-\U0001f1f4\U0001f1f7\U0001f1f9\U0001f1fb\U0001f1fc\U0001f1ff])|(?:\U0001f1fa[\U0001f1e6\U0001f1ec\U0001f1f2\U0001f1f8\U0001f1fe\U0001f1ff])|(?:\U0001f1fb[\U0001f1e6\U0001f1e8\U0001f1ea\U0001f1ec\U0001f1ee\U0001f1f3\U0001f1fa])|(?:\U0001f1fc[\U0001f1eb\U0001f1f8])|\U0001f1fd\U0001f1f0|(?:\U0001f1fd[\U0001f1f0])|(?:\U0001f1fe[\U0001f1ea\U0001f1f9])|(?:\U0001f1ff[\U0001f1e6\U0001f1f2\U0001f1fc])|(?:\U0001f3f3\ufe0f\u200d\U0001f308)|(?:\U0001f441\u200d\U0001f5e8)|(?:[\U0001f468\U0001f469]\u200d\u2764\ufe0f\u200d(?:\U0001f48b\u200d)?[\U0001f468\U0001f469])|(?:(?:(?:\U0001f468\u200d[\U0001f468\U0001f469])|(?:\U0001f469\u200d\U0001f469))(?:(?:\u200d\U0001f467(?:\u200d[\U0001f467\U0001f466])?)|(?:\u200d\U0001f466\u200d\U0001f466)))|(?:(?:(?:\U0001f468\u200d\U0001f468)|(?:\U0001f469\u200d\U0001f469))\u200d\U0001f466)|[\u2194-\u2199]|[\u23e9-\u23f3]|[\u23f8-\u23fa]|[\u25fb-\u25fe]|[\u2600-\u2604]|[\u2638-\u263a]|[\u2648-\u2653]|[\u2692-\u2694]|[\u26f0-\u26f5]|[\u26f7-\u26fa]|[\u2708-\u270d]|[\u2753-\u2755]|[\u2795-\u2797]|[\u2b05-\u2b07]|[\U0001f191-\U0001f19a]|[\U0001f1e6-\U0001f1ff]|[\U0001f232-\U0001f23a]|[\U0001f300-\U0001f321]|[\U0001f324-\U0001f393]|[\U0001f399-\U0001f39b]|[\U0001f39e-\U0001f3f0]|[\U0001f3f3-\U0001f3f5]|[\U0001f3f7-\U0001f3fa]|[\U0001f400-\U0001f4fd]|[\U0001f4ff-\U0001f53d]|[\U0001f549-\U0001f54e]|[\U0001f550-\U0001f567]|[\U0001f573-\U0001f57a]|[\U0001f58a-\U0001f58d]|[\U0001f5c2-\U0001f5c4]|[\U0001f5d1-\U0001f5d3]|[\U0001f5dc-\U0001f5de]|[\U0001f5fa-\U0001f64f]|[\U0001f680-\U0001f6c5]|[\U0001f6cb-\U0001f6d2]|[\U0001f6e0-\U0001f6e5]|[\U0001f6f3-\U0001f6f6]|[\U0001f910-\U0001f91e]|[\U0001f920-\U0001f927]|[\U0001f933-\U0001f93a]|[\U0001f93c-\U0001f93e]|[\U0001f940-\U0001f945]|[\U0001f947-\U0001f94b]|[\U0001f950-\U0001f95e]|[\U0001f980-\U0001f991]|\u00a9|\u00ae|\u203c|\u2049|\u2122|\u2139|\u21a9|\u21aa|\u231a|\u231b|\u2328|\u23cf|\u24c2|\u25aa|\u25ab|\u25b6|\u25c0|\u260e|\u2611|\u2614|\u2615|\u2618|\u261d|\u2620|\u2622|\u2623|\u2626|\u262a|\u262e|\u262f|\u2660|\u2663|\u2665|\u2666|\u2668|\u267b|\u267f|\u2696|\u2697|\u2699|\u269b|\u269c|\u26a0|\u26a1|\u26aa|\u26ab|\u26b0|\u26b1|\u26bd|\u26be|\u26c4|\u26c5|\u26c8|\u26ce|\u26cf|\u26d1|\u26d3|\u26d4|\u26e9|\u26ea|\u26fd|\u2702|\u2705|\u270f|\u2712|\u2714|\u2716|\u271d|\u2721|\u2728|\u2733|\u2734|\u2744|\u2747|\u274c|\u274e|\u2757|\u2763|\u2764|\u27a1|\u27b0|\u27bf|\u2934|\u2935|\u2b1b|\u2b1c|\u2b50|\u2b55|\u3030|\u303d|\u3297|\u3299|\U0001f004|\U0001f0cf|\U0001f170|\U0001f171|\U0001f17e|\U0001f17f|\U0001f18e|\U0001f201|\U0001f202|\U0001f21a|\U0001f22f|\U0001f250|\U0001f251|\U0001f396|\U0001f397|\U0001f56f|\U0001f570|\U0001f587|\U0001f590|\U0001f595|\U0001f596|\U0001f5a4|\U0001f5a5|\U0001f5a8|\U0001f5b1|\U0001f5b2|\U0001f5bc|\U0001f5e1|\U0001f5e3|\U0001f5e8|\U0001f5ef|\U0001f5f3|\U0001f6e9|\U0001f6eb|\U0001f6ec|\U0001f6f0|\U0001f930|\U0001f9c0|[#|0-9]\u20e3'
+)
+_MSG_ID_RE = re.compile(r'(?:(?P<channel_id>[0-9]{15,20})-)?(?P<message_id>[0-9]{15,20})$')
+_MSG_LINK_RE = re.compile(
+    r'https?://(?:(ptb|canary|www)\.)?discord(?:app)?\.com/channels/'
+    r'(?P<guild_id>[0-9]{15,20}|@me)'
+    r'/(?P<channel_id>[0-9]{15,20})/(?P<message_id>[0-9]{15,20})/?$'
+)
+_CHANNEL_ARG_RE = re.compile(
+    r'(?:([0-9]{15,20})|<#([0-9]{15,20})>|'
+    r'https?://(?:(?:ptb|canary|www)\.)?discord(?:app)?\.com/channels/'
+    r'(?:[0-9]{15,20}|@me)'
+    r'/([0-9]{15,20})(?:/(?:[0-9]{15,20})/?)?)$'
+)
+_EVENT_URL_RE = re.compile(
+    r'https?://(?:(ptb|canary|www)\.)?discord\.com/events/(?P<guild_id>[0-9]{15,20})/(?P<event_id>[0-9]{15,20})$', re.I
+)
+_TIME_TOKEN_RE = re.compile(r'(\d+\.?\d*)\s*([a-zA-Z]+)')
+_CLEAN_MENTION_RE = re.compile(r'<(@[!&]?|#)([0-9]{15,20})>')
+
+_ID_MATCH = _ID_REGEX.match
+
+
+def _get_matched_id(match: re.Match[str]) -> int:
+    return int(match[match.lastindex])  # type: ignore # lastindex is always set for the patterns above
+
+
+def _get_id(argument: str, regex: re.Pattern[str] = _ID_REGEX) -> Optional[int]:
+    # Plain IDs are the most common argument, so check for them without the regex engine
+    if 15 <= len(argument) <= 20 and argument.isdigit() and argument.isascii():
+        return int(argument)
+
+    match = regex.match(argument)
+    if match is None:
+        return None
+    return _get_matched_id(match)
 
 
 class IDConverter(Converter[T_co]):
-    @staticmethod
-    def _get_id_match(argument):
-        return _ID_REGEX.match(argument)
+    _get_id_match = staticmethod(_ID_MATCH)
 
 
 class ObjectConverter(IDConverter[discord.Object]):
@@ -177,13 +255,11 @@ class ObjectConverter(IDConverter[discord.Object]):
     """
 
     async def convert(self, ctx: Context[BotT], argument: str) -> discord.Object:
-        match = self._get_id_match(argument) or re.match(r'<(?:@(?:!|&)?|#)([0-9]{15,20})>$', argument)
+        result = _get_id(argument, _OBJECT_ARG_RE)
 
-        if match is None:
+        if result is None:
             raise ObjectNotFound(argument)
 
-        result = int(match.group(1))
-
         return discord.Object(id=result)
 
 
@@ -224,14 +300,17 @@ class MemberConverter(IDConverter[discord.Member]):
             discriminator, username = username, discriminator
 
         if discriminator == '0' or (len(discriminator) == 4 and discriminator.isdigit()):
-            lookup = username
-            predicate = lambda m: m.name == username and m.discriminator == discriminator
+            members = await guild.query_members(username, limit=100, cache=cache)
+            for member in members:
+                if member.name == username and member.discriminator == discriminator:
+                    return member
         else:
-            lookup = argument
-            predicate = lambda m: m.name == argument or m.global_name == argument or m.nick == argument
+            members = await guild.query_members(argument, limit=100, cache=cache)
+            for member in members:
+                if argument in (member.name, member.global_name, member.nick):
+                    return member
 
-        members = await guild.query_members(lookup, limit=100, cache=cache)
-        return discord.utils.find(predicate, members)
+        return None
 
     async def query_member_by_id(self, bot: _Bot, guild: discord.Guild, user_id: int) -> Optional[discord.Member]:
         ws = bot._get_websocket(shard_id=guild.shard_id)
@@ -256,25 +335,28 @@ class MemberConverter(IDConverter[discord.Member]):
 
     async def convert(self, ctx: Context[BotT], argument: str) -> discord.Member:
         bot = ctx.bot
-        match = self._get_id_match(argument) or re.match(r'<@!?([0-9]{15,20})>$', argument)
+        user_id = _get_id(argument, _USER_ARG_RE)
         guild = ctx.guild
         result = None
-        user_id = None
 
-        if match is None:
+        if user_id is None:
             # not a mention...
             if guild:
                 result = guild.get_member_named(argument)
             else:
                 result = _get_from_guilds(bot, 'get_member_named', argument)
         else:
-            user_id = int(match.group(1))
             if guild:
-                result = guild.get_member(user_id) or _utils_get(ctx.message.mentions, id=user_id)
+                result = guild.get_member(user_id)
+                if result is None:
+                    # Mentions can hold a plain User, the only place the type isn't known up front
+                    mentioned = _utils_get(ctx.message.mentions, id=user_id)
+                    if isinstance(mentioned, discord.Member):
+                        result = mentioned
             else:
                 result = _get_from_guilds(bot, 'get_member', user_id)
 
-        if not isinstance(result, discord.Member):
+        if result is None:
             if guild is None:
                 raise MemberNotFound(argument)
 
@@ -316,33 +398,21 @@ class UserConverter(IDConverter[discord.User]):
     """
 
     async def convert(self, ctx: Context[BotT], argument: str) -> discord.User:
-        match = self._get_id_match(argument) or re.match(r'<@!?([0-9]{15,20})>$', argument)
+        user_id = _get_id(argument, _USER_ARG_RE)
         result = None
-        state = ctx._state
 
-        if match is not None:
-            user_id = int(match.group(1))
-            result = ctx.bot.get_user(user_id) or _utils_get(ctx.message.mentions, id=user_id)
+        if user_id is not None:
+            bot = ctx.bot
+            result = bot.get_user(user_id) or _utils_get(ctx.message.mentions, id=user_id)
             if result is None:
                 try:
-                    result = await ctx.bot.fetch_user(user_id)
+                    result = await bot.fetch_user(user_id)
                 except discord.HTTPException:
                     raise UserNotFound(argument) from None
 
             return result  # type: ignore
 
-        username, _, discriminator = argument.rpartition('#')
-
-        # If # isn't found then "discriminator" actually has the username
-        if not username:
-            discriminator, username = username, discriminator
-
-        if discriminator == '0' or (len(discriminator) == 4 and discriminator.isdigit()):
-            predicate = lambda u: u.name == username and u.discriminator == discriminator
-        else:
-            predicate = lambda u: u.name == argument or u.global_name == argument
-
-        result = discord.utils.find(predicate, state._users.values())
+        result = _get_user_named(ctx._state, argument)
         if result is None:
             raise UserNotFound(argument)
 
@@ -363,13 +433,9 @@ class PartialMessageConverter(Converter[discord.PartialMessage]):
 
     @staticmethod
     def _get_id_matches(ctx: Context[BotT], argument: str) -> Tuple[Optional[int], int, int]:
-        id_regex = re.compile(r'(?:(?P<channel_id>[0-9]{15,20})-)?(?P<message_id>[0-9]{15,20})$')
-        link_regex = re.compile(
-            r'https?://(?:(ptb|canary|www)\.)?discord(?:app)?\.com/channels/'
-            r'(?P<guild_id>[0-9]{15,20}|@me)'
-            r'/(?P<channel_id>[0-9]{15,20})/(?P<message_id>[0-9]{15,20})/?$'
-        )
-        match = id_regex.match(argument) or link_regex.match(argument)
+        # IDs always start with a digit and links never do, so only one pattern needs to run
+        regex = _MSG_ID_RE if argument[:1].isdigit() else _MSG_LINK_RE
+        match = regex.match(argument)
         if not match:
             raise MessageNotFound(argument)
         data = match.groupdict()
@@ -377,7 +443,8 @@ class PartialMessageConverter(Converter[discord.PartialMessage]):
         message_id = int(data['message_id'])
         guild_id = data.get('guild_id')
         if guild_id is None:
-            guild_id = ctx.guild and ctx.guild.id
+            guild = ctx.guild
+            guild_id = guild and guild.id
         elif guild_id == '@me':
             guild_id = None
         else:
@@ -392,13 +459,14 @@ class PartialMessageConverter(Converter[discord.PartialMessage]):
             # we were passed just a message id so we can assume the channel is the current context channel
             return ctx.channel
 
+        bot = ctx.bot
         if guild_id is not None:
-            guild = ctx.bot.get_guild(guild_id)
+            guild = bot.get_guild(guild_id)
             if guild is None:
                 return None
             return guild._resolve_channel(channel_id)
 
-        return ctx.bot.get_channel(channel_id)
+        return bot.get_channel(channel_id)
 
     async def convert(self, ctx: Context[BotT], argument: str) -> discord.PartialMessage:
         guild_id, message_id, channel_id = self._get_id_matches(ctx, argument)
@@ -461,32 +529,18 @@ class GuildChannelConverter(IDConverter[discord.abc.GuildChannel]):
     async def convert(self, ctx: Context[BotT], argument: str) -> discord.abc.GuildChannel:
         return self._resolve_channel(ctx, argument, 'channels', discord.abc.GuildChannel)
 
-    @staticmethod
-    def _parse_from_url(argument: str) -> Optional[re.Match[str]]:
-        link_regex = re.compile(
-            r'https?://(?:(?:ptb|canary|www)\.)?discord(?:app)?\.com/channels/'
-            r'(?:[0-9]{15,20}|@me)'
-            r'/([0-9]{15,20})(?:/(?:[0-9]{15,20})/?)?$'
-        )
-        return link_regex.match(argument)
-
     @staticmethod
     def _resolve_channel(ctx: Context[BotT], argument: str, attribute: str, type: Type[CT]) -> CT:
         bot = ctx.bot
 
-        match = (
-            IDConverter._get_id_match(argument)
-            or re.match(r'<#([0-9]{15,20})>$', argument)
-            or GuildChannelConverter._parse_from_url(argument)
-        )
+        channel_id = _get_id(argument, _CHANNEL_ARG_RE)
         result = None
         guild = ctx.guild
 
-        if match is None:
+        if channel_id is None:
             # not a mention
             if guild:
-                iterable: Iterable[CT] = getattr(guild, attribute)
-                result: Optional[CT] = discord.utils.get(iterable, name=argument)
+                result: Optional[CT] = _get_channel_named(guild, attribute, type, argument)
             else:
 
                 def check(c):
@@ -494,35 +548,33 @@ class GuildChannelConverter(IDConverter[discord.abc.GuildChannel]):
 
                 result = discord.utils.find(check, bot.get_all_channels())  # type: ignore
         else:
-            channel_id = int(match.group(1))
             if guild:
                 # guild.get_channel returns an explicit union instead of the base class
                 result = guild.get_channel(channel_id)  # type: ignore
             else:
                 result = _get_from_guilds(bot, 'get_channel', channel_id)
 
-        if not isinstance(result, type):
+            # The name lookups above already filter by type, an ID can point to any channel
+            if not isinstance(result, type):
+                result = None
+
+        if result is None:
             raise ChannelNotFound(argument)
 
         return result
 
     @staticmethod
     def _resolve_thread(ctx: Context[BotT], argument: str, attribute: str, type: Type[TT]) -> TT:
-        match = (
-            IDConverter._get_id_match(argument)
-            or re.match(r'<#([0-9]{15,20})>$', argument)
-            or GuildChannelConverter._parse_from_url(argument)
-        )
+        thread_id = _get_id(argument, _CHANNEL_ARG_RE)
         result = None
         guild = ctx.guild
 
-        if match is None:
+        if thread_id is None:
             # not a mention
             if guild:
                 iterable: Iterable[TT] = getattr(guild, attribute)
                 result: Optional[TT] = discord.utils.get(iterable, name=argument)
         else:
-            thread_id = int(match.group(1))
             if guild:
                 result = guild.get_thread(thread_id)  # type: ignore
 
@@ -699,18 +751,136 @@ class ColourConverter(Converter[discord.Colour]):
     """
 
     async def convert(self, ctx: Context[BotT], argument: str) -> discord.Colour:
-        try:
-            return discord.Colour.from_str(argument)
-        except ValueError:
-            arg = argument.lower().replace(' ', '_')
-            method = getattr(discord.Colour, arg, None)
-            if arg.startswith('from_') or method is None or not inspect.ismethod(method):
-                raise BadColourArgument(arg)
-            return method()
+        # Only hand over the formats Colour.from_str understands, so named
+        # colours don't have to go through a raised ValueError first.
+        if argument.startswith(('#', '0x')) or argument[:3].lower() == 'rgb':
+            try:
+                return discord.Colour.from_str(argument)
+            except ValueError:
+                pass
+
+        arg = argument.lower().replace(' ', '_')
+        method = _COLOUR_METHODS.get(arg)
+        if method is None:
+            raise BadColourArgument(arg)
+        return method()
 
 
 ColorConverter = ColourConverter
 
+# The named colour classmethods, e.g. Colour.red, that ColourConverter accepts
+_COLOUR_METHODS: Dict[str, Callable[[], discord.Colour]] = {
+    name: getattr(discord.Colour, name)
+    for name in dir(discord.Colour)
+    if not name.startswith('from_') and inspect.ismethod(getattr(discord.Colour, name))
+}
+
+
+def _levenshtein_distance(s1: str, s2: str, cutoff: Optional[int] = None) -> int:
+    # If cutoff is given, any distance above it is reported as cutoff + 1
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+
+    if cutoff is None:
+        cutoff = len(s1)
+    elif len(s1) - len(s2) > cutoff:
+        return cutoff + 1
+
+    if not s2:
+        return len(s1)
+
+    # Two rows are enough for the DP table, they're swapped after every pass
+    previous_row = list(range(len(s2) + 1))
+    current_row = [0] * (len(s2) + 1)
+    for i, c1 in enumerate(s1, 1):
+        current_row[0] = left = row_min = i
+        for j, c2 in enumerate(s2):
+            distance = previous_row[j] if c1 == c2 else previous_row[j] + 1
+            if previous_row[j + 1] + 1 < distance:
+                distance = previous_row[j + 1] + 1
+            if left + 1 < distance:
+                distance = left + 1
+            current_row[j + 1] = left = distance
+            if distance < row_min:
+                row_min = distance
+
+        # Distances never shrink from one row to the next
+        if row_min > cutoff:
+            return cutoff + 1
+        previous_row, current_row = current_row, previous_row
+
+    distance = previous_row[-1]
+    return distance if distance <= cutoff else cutoff + 1
+
+
+def _fuzzy_search_roles(
+    converter: RoleConverter, query: str, lowered: List[Tuple[discord.Role, str]], threshold: float
+) -> Optional[discord.Role]:
+    # lowered holds (role, lowercased role name) pairs so they can be shared between searches
+    query_lower = query.lower()
+
+    # A substring (or exact) match always wins, so look for one before doing any scoring
+    for choice, choice_name in lowered:
+        if query_lower in choice_name:
+            return choice
+
+    best_match: Optional[discord.Role] = None
+    best_score = -1
+    min_distance = float('inf')
+
+    cls = type(converter)
+    if (
+        cls.word_match_score is not RoleConverter.word_match_score
+        or cls.normalized_levenshtein is not RoleConverter.normalized_levenshtein
+    ):
+        # A subclass customised the scoring, so every role is ranked through its hooks
+        for choice, choice_name in lowered:
+            score = converter.word_match_score(query_lower, choice_name)
+            distance = converter.normalized_levenshtein(query_lower, choice_name)
+
+            if (score > best_score) or (score == best_score and distance < min_distance):
+                best_score = score
+                min_distance = distance
+                best_match = choice
+
+        if best_match is not None and min_distance <= threshold:
+            return best_match
+
+        return None
+
+    query_words = set(query_lower.split())
+    query_len = len(query_lower)
+
+    for choice, choice_name in lowered:
+        # Same as word_match_score, with the query words only split once
+        score = len(query_words.intersection(choice_name.split()))
+        if score < best_score:
+            continue
+
+        choice_len = len(choice_name)
+        max_len = max(query_len, choice_len)
+        cutoff = None
+        if score == best_score:
+            # The length difference is a lower bound of the distance, skip
+            # choices that cannot beat the current best match.
+            if abs(query_len - choice_len) / max_len >= min_distance:
+                continue
+            # Anything past this can't be closer than the current best match
+            cutoff = int(min_distance * max_len)
+
+        # Same as normalized_levenshtein, but the cutoff lets hopeless choices bail out early
+        distance = converter.levenshtein_distance(query_lower, choice_name, cutoff) / max_len
+
+        if (score > best_score) or (distance < min_distance):
+            best_score = score
+            min_distance = distance
+            best_match = choice
+
+    if best_match is not None and min_distance <= threshold:
+        return best_match
+
+    return None
+
 
 class RoleConverter(IDConverter[discord.Role]):
     """Converts to a :class:`~discord.Role`.
@@ -728,34 +898,22 @@ class RoleConverter(IDConverter[discord.Role]):
          Raise :exc:`.RoleNotFound` instead of generic :exc:`.BadArgument`
     """
 
-    def levenshtein_distance(self, s1: str, s2: str) -> int:
+    def levenshtein_distance(self, s1: str, s2: str, cutoff: Optional[int] = None) -> int:
         """
         Calculate the Levenshtein distance between two strings.
 
         Args:
             s1 (str): The first string.
             s2 (str): The second string.
+            cutoff (int, optional): The largest distance of interest. If the distance
+                                    is larger, ``cutoff + 1`` is returned instead.
 
         Returns:
             int: The Levenshtein distance between the two strings.
         """
-        if len(s1) < len(s2):
-            return self.levenshtein_distance(s2, s1)
-
-        if not s2:
-            return len(s1)
-
-        previous_row = range(len(s2) + 1)
-        for i, c1 in enumerate(s1):
-            current_row = [i + 1]
-            for j, c2 in enumerate(s2):
-                insertions = previous_row[j + 1] + 1
-                deletions = current_row[j] + 1
-                substitutions = previous_row[j] + (c1 != c2)
-                current_row.append(min(insertions, deletions, substitutions))
-            previous_row = current_row
-
-        return previous_row[-1]
+        if _HAS_RAPIDFUZZ:
+            return _Levenshtein.distance(s1, s2, score_cutoff=cutoff)
+        return _levenshtein_distance(s1, s2, cutoff)
 
     def normalized_levenshtein(self, s1: str, s2: str) -> float:
         """
@@ -802,33 +960,7 @@ class RoleConverter(IDConverter[discord.Role]):
             Optional[discord.Role]: The closest match to the query from the list of choices.
                                     If no match is within the threshold, or the list is empty, returns None.
         """
-        best_match: Optional[discord.Role] = None
-        best_score = -1
-        min_distance = float('inf')
-
-        query_lower = query.lower()
-
-        for choice in choices:
-            choice_name = choice.name.lower()
-
-            if query_lower == choice_name:
-                return choice
-
-            if query_lower in choice_name:
-                return choice
-
-            score = self.word_match_score(query_lower, choice_name)
-            distance = self.normalized_levenshtein(query_lower, choice_name)
-
-            if (score > best_score) or (score == best_score and distance < min_distance):
-                best_score = score
-                min_distance = distance
-                best_match = choice
-
-        if best_match is not None and min_distance <= threshold:
-            return best_match
-
-        return None
+        return _fuzzy_search_roles(self, query, [(choice, choice.name.lower()) for choice in choices], threshold)
 
     async def convert(self, ctx: Context, argument: str) -> Union[List[discord.Role], discord.Role]:
         guild = ctx.guild
@@ -837,9 +969,9 @@ class RoleConverter(IDConverter[discord.Role]):
 
         result = None
 
-        match = self._get_id_match(argument) or re.match(r'<@&([0-9]{15,20})>$', argument)
-        if match:
-            result = guild.get_role(int(match.group(1)))
+        role_id = _get_id(argument, _ROLE_ARG_RE)
+        if role_id is not None:
+            result = guild.get_role(role_id)
 
         if result is None:
             # If no exact match is found, attempt a fuzzy search with ranking
@@ -872,10 +1004,30 @@ class RolesConverter(IDConverter[List[discord.Role]]):
         if not guild:
             raise NoPrivateMessage()
 
+        converter = RoleConverter()
+        lowered: Optional[List[Tuple[discord.Role, str]]] = None
+        resolved: Dict[str, discord.Role] = {}
+
         results: List[discord.Role] = []
         for arg in argument.split(','):
-            role = await RoleConverter().convert(ctx, arg.strip())
-            assert isinstance(role, discord.Role), "Role must be a discord.Role instance."
+            arg = arg.strip()
+            role = resolved.get(arg)
+            if role is None:
+                role_id = _get_id(arg, _ROLE_ARG_RE)
+                if role_id is not None:
+                    role = guild.get_role(role_id)
+
+                if role is None:
+                    # guild.roles is rebuilt on each access, so lower the names once for every argument
+                    if lowered is None:
+                        lowered = [(r, r.name.lower()) for r in guild.roles]
+                    role = _fuzzy_search_roles(converter, arg, lowered, threshold=3)
+
+                if role is None:
+                    raise RoleNotFound(arg)
+
+                resolved[arg] = role
+
             results.append(role)
 
         if not results:
@@ -884,6 +1036,50 @@ class RolesConverter(IDConverter[List[discord.Role]]):
         return results
 
 
+_TIME_BASE_UNITS = {'ms': 0.001, 's': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800, 'y': 31536000}
+
+_TIME_UNITS: Dict[str, float] = {
+    key: value
+    for unit, value in _TIME_BASE_UNITS.items()
+    for key in (
+        unit,
+        f'{unit}s',
+        f'{unit}ec',
+        f'{unit}ecs',
+        f'{unit}in',
+        f'{unit}ins',
+        f'{unit}inute',
+        f'{unit}inutes',
+        f'{unit}our',
+        f'{unit}ours',
+        f'{unit}ay',
+        unit + 'ays',
+        unit + 'eek',
+        unit + 'eeks',
+        unit + 'ear',
+        unit + 'ears',
+        unit + 'illisecond',
+        unit + 'illiseconds',
+    )
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_timedelta(argument: str) -> datetime.timedelta:
+    matches = _TIME_TOKEN_RE.findall(argument)
+    if not matches:
+        raise BadArgument(f"Could not parse any time units from '{argument}'")
+
+    seconds = 0.0
+    for value, unit in matches:
+        seconds += float(value) * _TIME_UNITS.get(unit.lower(), 0)
+
+    time = datetime.timedelta(seconds=seconds)
+    if time.total_seconds() == 0:
+        raise BadArgument(f"Invalid time unit in '{argument}'")
+    return time
+
+
 class TimeDeltaConverter(Converter[datetime.timedelta]):
     """Converts to a :class:`~datetime.timedelta`.
 
@@ -901,43 +1097,7 @@ class TimeDeltaConverter(Converter[datetime.timedelta]):
 
     async def convert(self, ctx: Context, argument: str) -> datetime.timedelta:
         """Converts a string into a timedelta object."""
-        base_units = {'ms': 0.001, 's': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800, 'y': 31536000}
-
-        time_units = {
-            key: value
-            for unit, value in base_units.items()
-            for key in (
-                unit,
-                f'{unit}s',
-                f'{unit}ec',
-                f'{unit}ecs',
-                f'{unit}in',
-                f'{unit}ins',
-                f'{unit}inute',
-                f'{unit}inutes',
-                f'{unit}our',
-                f'{unit}ours',
-                f'{unit}ay',
-                unit + 'ays',
-                unit + 'eek',
-                unit + 'eeks',
-                unit + 'ear',
-                unit + 'ears',
-                unit + 'illisecond',
-                unit + 'illiseconds',
-            )
-        }
-
-        matches = re.findall(r'(\d+\.?\d*)\s*([a-zA-Z]+)', argument)
-        if not matches:
-            raise BadArgument(f"Could not parse any time units from '{argument}'")
-
-        time = datetime.timedelta(
-            seconds=sum(float(value) * time_units[unit] for value, unit in matches if unit in time_units)
-        )
-        if time.total_seconds() == 0:
-            raise BadArgument(f"Invalid time unit in '{argument}'")
-        return time
+        return _parse_timedelta(argument)
 
 
 class GameConverter(Converter[discord.Game]):
@@ -976,11 +1136,10 @@ class GuildConverter(IDConverter[discord.Guild]):
     """
 
     async def convert(self, ctx: Context[BotT], argument: str) -> discord.Guild:
-        match = self._get_id_match(argument)
+        guild_id = _get_id(argument)
         result = None
 
-        if match is not None:
-            guild_id = int(match.group(1))
+        if guild_id is not None:
             result = ctx.bot.get_guild(guild_id)
 
         if result is None:
@@ -1008,21 +1167,19 @@ class EmojiConverter(IDConverter[discord.Emoji]):
     """
 
     async def convert(self, ctx: Context[BotT], argument: str) -> discord.Emoji:
-        match = self._get_id_match(argument) or re.match(r'<a?:[a-zA-Z0-9\_]{1,32}:([0-9]{15,20})>$', argument)
+        emoji_id = _get_id(argument, _EMOJI_ARG_RE)
         result = None
         bot = ctx.bot
         guild = ctx.guild
 
-        if match is None:
+        if emoji_id is None:
             # Try to get the emoji by name. Try local guild first.
             if guild:
-                result = discord.utils.get(guild.emojis, name=argument)
+                result = guild._get_emoji_named(argument)
 
             if result is None:
                 result = discord.utils.get(bot.emojis, name=argument)
         else:
-            emoji_id = int(match.group(1))
-
             # Try to look up emoji by id.
             result = bot.get_emoji(emoji_id)
 
@@ -1042,7 +1199,7 @@ class PartialEmojiConverter(Converter[discord.PartialEmoji]):
     """
 
     async def convert(self, ctx: Context[BotT], argument: str) -> discord.PartialEmoji:
-        match = re.match(r'<(a?):([a-zA-Z0-9\_]{1,32}):([0-9]{15,20})>$', argument)
+        match = _PARTIAL_EMOJI_RE.match(argument)
 
         if match:
             emoji_animated = bool(match.group(1))
@@ -1077,37 +1234,33 @@ class BasicEmojiConverter(IDConverter[discord.BasicEmoji]):
     """
 
     async def convert(self, ctx: Context[BotT], argument: str) -> discord.BasicEmoji:
-        match = self._get_id_match(argument) or re.match(r'<a?:[a-zA-Z0-9\_]{1,32}:([0-9]{15,20})>$', argument)
+        emoji_id = _get_id(argument, _EMOJI_ARG_RE)
         result = None
         bot = ctx.bot
         guild = ctx.guild
 
-        if match is None:
+        if emoji_id is None:
             if guild:
-                result = discord.utils.get(guild.emojis, name=argument)
+                result = guild._get_emoji_named(argument)
 
             if result is None:
                 result = discord.utils.get(bot.emojis, name=argument)
 
-        if guild and match is not None:
+        if guild and emoji_id is not None:
             # Try to look up emoji by id.
-            result = guild.get_emoji(int(match.group(1)))
+            result = guild.get_emoji(emoji_id)
 
-        # Unicode match
-        unicode = re.match(
-            r'(?:\U0001f1e6[\U0001f1e8-\U0001f1ec\U0001f1ee\U0001f1f1\U0001f1f2\U0001f1f4\U0001f1f6-\U0001f1fa\U0001f1fc\U0001f1fd\U0001f1ff])|(?:\U0001f1e7[\U0001f1e6\U0001f1e7\U0001f1e9-\U0001f1ef\U0001f1f1-\U0001f1f4\U0001f1f6-\U0001f1f9\U0001f1fb\U0001f1fc\U0001f1fe\U0001f1ff])|(?:\U0001f1e8[\U0001f1e6\U0001f1e8\U0001f1e9\U0001f1eb-\U0001f1ee\U0001f1f0-\U0001f1f5\U0001f1f7\U0001f1fa-\U0001f1ff])|(?:\U0001f1e9[\U0001f1ea\U0001f1ec\U0001f1ef\U0001f1f0\U0001f1f2\U0001f1f4\U0001f1ff])|(?:\U0001f1ea[\U0001f1e6\U0001f1e8\U0001f1ea\U0001f1ec\U0001f1ed\U0001f1f7-\U0001f1fa])|(?:\U0001f1eb[\U0001f1ee-\U0001f1f0\U0001f1f2\U0001f1f4\U0001f1f7])|(?:\U0001f1ec[\U0001f1e6\U0001f1e7\U0001f1e9-\U0001f1ee\U0001f1f1-\U0001f1f3\U0001f1f5-\U0001f1fa\U0001f1fc\U0001f1fe])|(?:\U0001f1ed[\U0001f1f0\U0001f1f2\U0001f1f3\U0001f1f7\U0001f1f9\U0001f1fa])|(?:\U0001f1ee[\U0001f1e8-\U0001f1ea\U0001f1f1-\U0001f1f4\U0001f1f6-\U0001f1f9])|(?:\U0001f1ef[\U0001f1ea\U0001f1f2\U0001f1f4\U0001f1f5])|(?:\U0001f1f0[\U0001f1ea\U0001f1ec-\U0001f1ee\U0001f1f2\U0001f1f3\U0001f1f5\U0001f1f7\U0001f1fc\U0001f1fe\U0001f1ff])|(?:\U0001f1f1[\U0001f1e6-\U0001f1e8\U0001f1ee\U0001f1f0\U0001f1f7-\U0001f1fb\U0001f1fe])|(?:\U0001f1f2[\U0001f1e6\U0001f1e8-\U0001f1ed\U0001f1f0-\U0001f1ff])|(?:\U0001f1f3[\U0001f1e6\U0001f1e8\U0001f1ea-\U0001f1ec\U0001f1ee\U0001f1f1\U0001f1f4\U0001f1f5\U0001f1f7\U0001f1fa\U0001f1ff])|\U0001f1f4\U0001f1f2|(?:\U0001f1f4[\U0001f1f2])|(?:\U0001f1f5[\U0001f1e6\U0001f1ea-\U0001f1ed\U0001f1f0-\U0001f1f3\U0001f1f7-\U0001f1f9\U0001f1fc\U0001f1fe])|\U0001f1f6\U0001f1e6|(?:\U0001f1f6[\U0001f1e6])|(?:\U0001f1f7[\U0001f1ea\U0001f1f4\U0001f1f8\U0001f1fa\U0001f1fc])|(?:\U0001f1f8[\U0001f1e6-\U0001f1ea\U0001f1ec-\U0001f1f4\U0001f1f7-\U0001f1f9\U0001f1fb\U0001f1fd-\U0001f1ff])|(?:\U0001f1f9[\U0001f1e6\U0001f1e8\U0001f1e9\U0001f1eb-\U0001f1ed\U0001f1ef-\U0001f1f4\U0001f1f7\U0001f1f9\U0001f1fb\U0001f1fc\U0001f1ff])|(?:\U0001f1fa[\U0001f1e6\U0001f1ec\U0001f1f2\U0001f1f8\U0001f1fe\U0001f1ff])|(?:\U0001f1fb[\U0001f1e6\U0001f1e8\U0001f1ea\U0001f1ec\U0001f1ee\U0001f1f3\U0001f1fa])|(?:\U0001f1fc[\U0001f1eb\U0001f1f8])|\U0001f1fd\U0001f1f0|(?:\U0001f1fd[\U0001f1f0])|(?:\U0001f1fe[\U0001f1ea\U0001f1f9])|(?:\U0001f1ff[\U0001f1e6\U0001f1f2\U0001f1fc])|(?:\U0001f3f3\ufe0f\u200d\U0001f308)|(?:\U0001f441\u200d\U0001f5e8)|(?:[\U0001f468\U0001f469]\u200d\u2764\ufe0f\u200d(?:\U0001f48b\u200d)?[\U0001f468\U0001f469])|(?:(?:(?:\U0001f468\u200d[\U0001f468\U0001f469])|(?:\U0001f469\u200d\U0001f469))(?:(?:\u200d\U0001f467(?:\u200d[\U0001f467\U0001f466])?)|(?:\u200d\U0001f466\u200d\U0001f466)))|(?:(?:(?:\U0001f468\u200d\U0001f468)|(?:\U0001f469\u200d\U0001f469))\u200d\U0001f466)|[\u2194-\u2199]|[\u23e9-\u23f3]|[\u23f8-\u23fa]|[\u25fb-\u25fe]|[\u2600-\u2604]|[\u2638-\u263a]|[\u2648-\u2653]|[\u2692-\u2694]|[\u26f0-\u26f5]|[\u26f7-\u26fa]|[\u2708-\u270d]|[\u2753-\u2755]|[\u2795-\u2797]|[\u2b05-\u2b07]|[\U0001f191-\U0001f19a]|[\U0001f1e6-\U0001f1ff]|[\U0001f232-\U0001f23a]|[\U0001f300-\U0001f321]|[\U0001f324-\U0001f393]|[\U0001f399-\U0001f39b]|[\U0001f39e-\U0001f3f0]|[\U0001f3f3-\U0001f3f5]|[\U0001f3f7-\U0001f3fa]|[\U0001f400-\U0001f4fd]|[\U0001f4ff-\U0001f53d]|[\U0001f549-\U0001f54e]|[\U0001f550-\U0001f567]|[\U0001f573-\U0001f57a]|[\U0001f58a-\U0001f58d]|[\U0001f5c2-\U0001f5c4]|[\U0001f5d1-\U0001f5d3]|[\U0001f5dc-\U0001f5de]|[\U0001f5fa-\U0001f64f]|[\U0001f680-\U0001f6c5]|[\U0001f6cb-\U0001f6d2]|[\U0001f6e0-\U0001f6e5]|[\U0001f6f3-\U0001f6f6]|[\U0001f910-\U0001f91e]|[\U0001f920-\U0001f927]|[\U0001f933-\U0001f93a]|[\U0001f93c-\U0001f93e]|[\U0001f940-\U0001f945]|[\U0001f947-\U0001f94b]|[\U0001f950-\U0001f95e]|[\U0001f980-\U0001f991]|\u00a9|\u00ae|\u203c|\u2049|\u2122|\u2139|\u21a9|\u21aa|\u231a|\u231b|\u2328|\u23cf|\u24c2|\u25aa|\u25ab|\u25b6|\u25c0|\u260e|\u2611|\u2614|\u2615|\u2618|\u261d|\u2620|\u2622|\u2623|\u2626|\u262a|\u262e|\u262f|\u2660|\u2663|\u2665|\u2666|\u2668|\u267b|\u267f|\u2696|\u2697|\u2699|\u269b|\u269c|\u26a0|\u26a1|\u26aa|\u26ab|\u26b0|\u26b1|\u26bd|\u26be|\u26c4|\u26c5|\u26c8|\u26ce|\u26cf|\u26d1|\u26d3|\u26d4|\u26e9|\u26ea|\u26fd|\u2702|\u2705|\u270f|\u2712|\u2714|\u2716|\u271d|\u2721|\u2728|\u2733|\u2734|\u2744|\u2747|\u274c|\u274e|\u2757|\u2763|\u2764|\u27a1|\u27b0|\u27bf|\u2934|\u2935|\u2b1b|\u2b1c|\u2b50|\u2b55|\u3030|\u303d|\u3297|\u3299|\U0001f004|\U0001f0cf|\U0001f170|\U0001f171|\U0001f17e|\U0001f17f|\U0001f18e|\U0001f201|\U0001f202|\U0001f21a|\U0001f22f|\U0001f250|\U0001f251|\U0001f396|\U0001f397|\U0001f56f|\U0001f570|\U0001f587|\U0001f590|\U0001f595|\U0001f596|\U0001f5a4|\U0001f5a5|\U0001f5a8|\U0001f5b1|\U0001f5b2|\U0001f5bc|\U0001f5e1|\U0001f5e3|\U0001f5e8|\U0001f5ef|\U0001f5f3|\U0001f6e9|\U0001f6eb|\U0001f6ec|\U0001f6f0|\U0001f930|\U0001f9c0|[#|0-9]\u20e3',
-            argument,
-        )
-
-        if unicode:
+        # Unicode match, the only ASCII characters that can start an emoji are keycap bases
+        first = argument[:1]
+        if (first > '\x7f' or first in _KEYCAP_BASES) and _UNICODE_EMOJI_RE.match(argument):
             result = argument
 
         if result is None:
             raise BasicEmojiConversionFailure(argument)
 
         if isinstance(result, str):
-            return discord.BasicEmoji(name=result)
-        return discord.BasicEmoji(name=str(result), is_custom_emoji=True)
+            return discord.BasicEmoji.get(result)
+        return discord.BasicEmoji.get(str(result), is_custom_emoji=True)
 
 
 class GuildStickerConverter(IDConverter[discord.GuildSticker]):
@@ -1125,21 +1278,19 @@ class GuildStickerConverter(IDConverter[discord.GuildSticker]):
     """
 
     async def convert(self, ctx: Context[BotT], argument: str) -> discord.GuildSticker:
-        match = self._get_id_match(argument)
+        sticker_id = _get_id(argument)
         result = None
         bot = ctx.bot
         guild = ctx.guild
 
-        if match is None:
+        if sticker_id is None:
             # Try to get the sticker by name. Try local guild first.
             if guild:
-                result = discord.utils.get(guild.stickers, name=argument)
+                result = guild._get_sticker_named(argument)
 
             if result is None:
                 result = discord.utils.get(bot.stickers, name=argument)
         else:
-            sticker_id = int(match.group(1))
-
             # Try to look up sticker by id.
             result = bot.get_sticker(sticker_id)
 
@@ -1166,26 +1317,17 @@ class ScheduledEventConverter(IDConverter[discord.ScheduledEvent]):
 
     async def convert(self, ctx: Context[BotT], argument: str) -> discord.ScheduledEvent:
         guild = ctx.guild
-        match = self._get_id_match(argument)
+        event_id = _get_id(argument)
         result = None
 
-        if match:
+        if event_id is not None:
             # ID match
-            event_id = int(match.group(1))
             if guild:
                 result = guild.get_scheduled_event(event_id)
             else:
-                for guild in ctx.bot.guilds:
-                    result = guild.get_scheduled_event(event_id)
-                    if result:
-                        break
+                result = ctx.bot._connection._get_scheduled_event(event_id)
         else:
-            pattern = (
-                r'https?://(?:(ptb|canary|www)\.)?discord\.com/events/'
-                r'(?P<guild_id>[0-9]{15,20})/'
-                r'(?P<event_id>[0-9]{15,20})$'
-            )
-            match = re.match(pattern, argument, flags=re.I)
+            match = _EVENT_URL_RE.match(argument)
             if match:
                 # URL match
                 guild = ctx.bot.get_guild(int(match.group('guild_id')))
@@ -1274,20 +1416,16 @@ class clean_content(Converter[str]):
             def resolve_channel(id: int) -> str:
                 return f'<#{id}>'
 
-        transforms = {
-            '@': resolve_member,
-            '@!': resolve_member,
-            '#': resolve_channel,
-            '@&': resolve_role,
-        }
-
         def repl(match: re.Match) -> str:
             type = match[1]
             id = int(match[2])
-            transformed = transforms[type](id)
-            return transformed
+            if type == '#':
+                return resolve_channel(id)
+            elif type == '@&':
+                return resolve_role(id)
+            return resolve_member(id)
 
-        result = re.sub(r'<(@[!&]?|#)([0-9]{15,20})>', repl, argument)
+        result = _CLEAN_MENTION_RE.sub(repl, argument)
         if self.escape_markdown:
             result = discord.utils.escape_markdown(result)
         elif self.remove_markdown:
@@ -1297,6 +1435,11 @@ class clean_content(Converter[str]):
         return discord.utils.escape_mentions(result)
 
 
+# Subscriptions such as Greedy[int] or Range[int, 1, 10] are evaluated for every annotation using them
+_greedy_cache: Dict[Tuple[Any, Any], Greedy[Any]] = {}
+_range_cache: Dict[Tuple[Any, Tuple[Any, ...], Tuple[type, ...]], Any] = {}
+
+
 class Greedy(List[T]):
     r"""A special converter that greedily consumes arguments until it can't.
     As a consequence of this behaviour, most input errors are silently discarded,
@@ -1341,6 +1484,14 @@ class Greedy(List[T]):
             raise TypeError('Greedy[...] only takes a single argument')
         converter = params[0]
 
+        # Only plain classes are memoized, typing constructs such as Union compare equal regardless of order
+        memoize = isinstance(converter, type)
+        if memoize:
+            try:
+                return _greedy_cache[cls, converter]
+            except KeyError:
+                pass
+
         args = getattr(converter, '__args__', ())
         if discord.utils.PY_310 and converter.__class__ is types.UnionType:  # type: ignore
             converter = Union[args]  # type: ignore
@@ -1356,7 +1507,10 @@ class Greedy(List[T]):
         if origin is Union and type(None) in args:
             raise TypeError(f'Greedy[{converter!r}] is invalid.')
 
-        return cls(converter=converter)
+        greedy = cls(converter=converter)
+        if memoize:
+            _greedy_cache[cls, converter] = greedy
+        return greedy
 
     @property
     def constructed_converter(self) -> Any:
@@ -1422,18 +1576,21 @@ else:
                 raise TypeError('minimum cannot be larger than maximum')
 
         async def convert(self, ctx: Context[BotT], value: str) -> Union[int, float]:
-            try:
-                count = converted = self.annotation(value)
-            except ValueError:
-                raise BadArgument(
-                    f'Converting to "{self.annotation.__name__}" failed for parameter "{ctx.current_parameter.name}".'
-                )
-
-            if self.annotation is str:
+            annotation = self.annotation
+            if annotation is str:
+                converted = value
                 count = len(value)
+            else:
+                try:
+                    count = converted = annotation(value)
+                except ValueError:
+                    raise BadArgument(
+                        f'Converting to "{annotation.__name__}" failed for parameter "{ctx.current_parameter.name}".'
+                    )
 
-            if (self.min is not None and count < self.min) or (self.max is not None and count > self.max):
-                raise RangeError(converted, minimum=self.min, maximum=self.max)
+            min, max = self.min, self.max
+            if (min is not None and count < min) or (max is not None and count > max):
+                raise RangeError(converted, minimum=min, maximum=max)
 
             return converted
 
@@ -1451,6 +1608,13 @@ else:
             if not isinstance(obj, tuple):
                 raise TypeError(f'expected tuple for arguments, received {obj.__class__.__name__} instead')
 
+            # Equal values of different types (1, 1.0 and True) are validated differently
+            key = (cls, obj, tuple(type(o) for o in obj))
+            try:
+                return _range_cache[key]
+            except (KeyError, TypeError):
+                pass
+
             if len(obj) == 2:
                 obj = (*obj, None)
             elif len(obj) != 3:
@@ -1474,18 +1638,27 @@ else:
             else:
                 cast = float
 
-            return cls(
+            result = cls(
                 annotation=annotation,
                 min=cast(min) if min is not None else None,
                 max=cast(max) if max is not None else None,
             )
+            try:
+                _range_cache[key] = result
+            except TypeError:
+                pass
+            return result
+
+
+_BOOL_TRUE = frozenset(('yes', 'y', 'true', 't', '1', 'enable', 'on'))
+_BOOL_FALSE = frozenset(('no', 'n', 'false', 'f', '0', 'disable', 'off'))
 
 
 def _convert_to_bool(argument: str) -> bool:
     lowered = argument.lower()
-    if lowered in ('yes', 'y', 'true', 't', '1', 'enable', 'on'):
+    if lowered in _BOOL_TRUE:
         return True
-    elif lowered in ('no', 'n', 'false', 'f', '0', 'disable', 'off'):
+    elif lowered in _BOOL_FALSE:
         return False
     else:
         raise BadBoolArgument(lowered)
@@ -1526,36 +1699,69 @@ CONVERTER_MAPPING: Dict[type, Any] = {
     List[discord.Role]: RolesConverter,
 }
 
+# Keyed by id() since annotations are not always hashable, e.g. Greedy instances
+_MAPPED_DISCORD_TYPE_IDS = frozenset(
+    id(tp)
+    for tp in CONVERTER_MAPPING
+    if getattr(tp, '__module__', '').startswith('discord.') and not tp.__module__.endswith('converter')
+)
+
+
+_CONVERTER_CALLABLE = 0
+_CONVERTER_CLASS = 1
+_CONVERTER_CLASS_BOUND = 2
+_CONVERTER_INSTANCE = 3
+
+
+def _converter_kind(converter: Any) -> int:
+    if inspect.isclass(converter) and issubclass(converter, Converter):
+        # a classmethod convert is called on the class itself
+        if inspect.ismethod(converter.convert):
+            return _CONVERTER_CLASS_BOUND
+        return _CONVERTER_CLASS
+    elif isinstance(converter, Converter):
+        return _CONVERTER_INSTANCE
+    return _CONVERTER_CALLABLE
+
+
+_cached_converter_kind = functools.lru_cache(maxsize=256)(_converter_kind)
+
 
 async def _actual_conversion(ctx: Context[BotT], converter: Any, argument: str, param: inspect.Parameter):
     if converter is bool:
         return _convert_to_bool(argument)
 
-    try:
-        module = converter.__module__
-    except AttributeError:
-        pass
+    if id(converter) in _MAPPED_DISCORD_TYPE_IDS:
+        converter = CONVERTER_MAPPING.get(converter, converter)
     else:
-        if module is not None and (module.startswith('discord.') and not module.endswith('converter')):
-            converter = CONVERTER_MAPPING.get(converter, converter)
+        try:
+            module = converter.__module__
+        except AttributeError:
+            pass
+        else:
+            if module is not None and (module.startswith('discord.') and not module.endswith('converter')):
+                converter = CONVERTER_MAPPING.get(converter, converter)
 
-    origin = get_origin(converter)
-    if origin and (mapped_converter := CONVERTER_MAPPING.get(converter)):
-        converter = mapped_converter
+        origin = get_origin(converter)
+        if origin and (mapped_converter := CONVERTER_MAPPING.get(converter)):
+            converter = mapped_converter
 
     try:
-
-        if inspect.isclass(converter) and issubclass(converter, Converter):
-            if inspect.ismethod(converter.convert):
-                return await converter.convert(ctx, argument)
-            else:
-                return await converter().convert(ctx, argument)
-        elif isinstance(converter, Converter):
+        try:
+            kind = _cached_converter_kind(converter)
+        except TypeError:  # unhashable converter
+            kind = _converter_kind(converter)
+
+        if kind == _CONVERTER_CLASS_BOUND:
+            return await converter.convert(ctx, argument)
+        elif kind == _CONVERTER_CLASS:
+            return await converter().convert(ctx, argument)
+        elif kind == _CONVERTER_INSTANCE:
             return await converter.convert(ctx, argument)  # type: ignore
     except CommandError:
         raise
     except Exception as exc:
-        raise ConversionError(converter, exc) from exc  # type: ignore
+        raise ConversionError(converter, exc) from exc
 
     try:
         return converter(argument)
@@ -1570,6 +1776,195 @@ async def _actual_conversion(ctx: Context[BotT], converter: Any, argument: str,
         raise BadArgument(f'Converting to "{name}" failed for parameter "{param.name}".') from exc
 
 
+def _generic_origin(converter: Any) -> Any:
+    return converter.__origin__ if is_generic_type(converter) else None
+
+
+# Only the generic check is cached, CONVERTER_MAPPING is still consulted on every call so later changes apply
+_cached_generic_origin = functools.lru_cache(maxsize=256)(_generic_origin)
+
+
+def _union_nested(union_args: Tuple[Any, ...]) -> Tuple[bool, ...]:
+    # Arms without an origin would only pass through run_converters on their way to _actual_conversion
+    return tuple(getattr(conv, '__origin__', None) is not None for conv in union_args)
+
+
+# Keyed by the args tuple rather than the Union itself, since Unions compare equal regardless of order.
+# Only the flags are cached: nested Literals in an equal tuple may still list their values in another order.
+_cached_union_nested = functools.lru_cache(maxsize=256)(_union_nested)
+
+
+# Marks a literal type whose conversion failed, its literals are skipped
+_FAILED_CONVERSION: Tuple[Any, Optional[str]] = (object(), None)
+
+
+class _LiteralDescriptor:
+    __slots__ = ('types', 'entries', 'folded_lengths', 'folded_lookup', 'value_lookup')
+
+    def __init__(self, literal_args: Tuple[Any, ...]) -> None:
+        # distinct literal types in order of first appearance, each converted at most once per call
+        types: Dict[type, int] = {}
+        for literal in literal_args:
+            types.setdefault(type(literal), len(types))
+        self.types: Tuple[type, ...] = tuple(types)
+        # (literal, index into types, casefolded literal for string literals)
+        self.entries: Tuple[Tuple[Any, int, Optional[str]], ...] = tuple(
+            (literal, types[type(literal)], literal.casefold() if isinstance(literal, str) else None)
+            for literal in literal_args
+        )
+        self.folded_lengths: FrozenSet[int] = frozenset(len(folded) for _, _, folded in self.entries if folded is not None)
+        # When every literal has the same type, one conversion decides the match and a hash lookup
+        # can replace the scan. The first literal wins on duplicates, same as the scan.
+        self.folded_lookup: Optional[Dict[str, Any]] = None
+        self.value_lookup: Optional[FrozenSet[Any]] = None
+        if len(self.types) == 1:
+            if self.folded_lengths:
+                lookup: Dict[str, Any] = {}
+                for literal, _, folded in self.entries:
+                    lookup.setdefault(folded, literal)  # type: ignore
+                self.folded_lookup = lookup
+            else:
+                try:
+                    self.value_lookup = frozenset(literal for literal, _, _ in self.entries)
+                except TypeError:
+                    pass
+
+
+# Literal objects compare equal regardless of order and their args tuples treat 1 and True
+# as equal, so descriptors are keyed by identity and keep the Literal alive alongside.
+_literal_descriptors: Dict[int, Tuple[Any, _LiteralDescriptor]] = {}
+
+
+def _get_literal_descriptor(converter: Any) -> _LiteralDescriptor:
+    try:
+        cached, descriptor = _literal_descriptors[id(converter)]
+    except KeyError:
+        pass
+    else:
+        if cached is converter:
+            return descriptor
+
+    descriptor = _LiteralDescriptor(converter.__args__)
+    if len(_literal_descriptors) >= 1024:
+        _literal_descriptors.clear()
+    _literal_descriptors[id(converter)] = (converter, descriptor)
+    return descriptor
+
+
+async def _convert_literal(
+    ctx: Context[BotT],
+    converter: Any,
+    argument: str,
+    param: Parameter,
+    shared: Optional[Dict[type, Any]] = None,
+) -> Any:
+    # shared holds successful conversions from the enclosing Union, keyed by converter type
+    errors = []
+    literal_args = converter.__args__
+
+    descriptor = _get_literal_descriptor(converter)
+    literal_types = descriptor.types
+    conversions: List[Optional[Tuple[Any, Optional[str]]]] = [None] * len(literal_types)
+
+    for literal, index, folded in descriptor.entries:
+        conversion = conversions[index]
+        if conversion is None:
+            literal_type = literal_types[index]
+            if literal_type is str:
+                # converting to str hands the argument back unchanged
+                value = argument
+            elif shared is not None and literal_type in shared:
+                value = shared[literal_type]
+            else:
+                try:
+                    value = await _actual_conversion(ctx, literal_type, argument, param)
+                except CommandError as exc:
+                    errors.append(exc)
+                    conversions[index] = _FAILED_CONVERSION
+                    continue
+                if shared is not None:
+                    shared[literal_type] = value
+
+            if not isinstance(value, str):
+                folded_value = None
+            elif value.isascii() and len(value) not in descriptor.folded_lengths:
+                # casefold keeps the length of ASCII text, so this cannot match any literal anyway
+                folded_value = value
+            else:
+                folded_value = value.casefold()
+            conversions[index] = (value, folded_value)
+
+            if descriptor.folded_lookup is not None and folded_value is not None:
+                try:
+                    return descriptor.folded_lookup[folded_value]
+                except KeyError:
+                    break
+            if descriptor.value_lookup is not None:
+                try:
+                    if value in descriptor.value_lookup:
+                        return value
+                except TypeError:
+                    pass
+                else:
+                    break
+        elif conversion is _FAILED_CONVERSION:
+            # the argument is not of this literal's type, so nothing to compare
+            continue
+        else:
+            value, folded_value = conversion
+
+        if folded is not None and folded_value is not None:
+            if folded_value == folded:
+                return literal
+        elif value == literal:
+            return value
+
+    raise BadLiteralArgument(param, literal_args, errors, argument)
+
+
+async def _convert_union(ctx: Context[BotT], converter: Any, argument: str, param: Parameter) -> Any:
+    # only allocated once an arm fails, most arguments convert on the first arm
+    errors: Optional[List[CommandError]] = None
+    converted: Dict[type, Any] = {}
+    _NoneType = type(None)
+    union_args = converter.__args__
+    try:
+        nested_arms = _cached_union_nested(union_args)
+    except TypeError:  # unhashable member
+        nested_arms = _union_nested(union_args)
+
+    for conv, nested in zip(union_args, nested_arms):
+        if conv is _NoneType and param.kind != param.VAR_POSITIONAL:
+            ctx.view.undo()
+            return None if param.required else await param.get_default(ctx)
+
+        try:
+            if not nested:
+                if converted and isinstance(conv, type) and conv in converted:
+                    return converted[conv]
+                value = await _actual_conversion(ctx, conv, argument, param)
+            elif getattr(conv, '__origin__', None) is Literal:
+                value = await _convert_literal(ctx, conv, argument, param, converted)
+            else:
+                value = await run_converters(ctx, conv, argument, param)
+        except CommandError as exc:
+            if errors is None:
+                errors = [exc]
+            else:
+                errors.append(exc)
+        else:
+            return value
+
+    raise BadUnionArgument(param, union_args, errors or [])
+
+
+# Typing origins that are converted by their own handler rather than through _actual_conversion
+_ORIGIN_HANDLERS: Dict[Any, Callable[..., Any]] = {
+    Union: _convert_union,
+    Literal: _convert_literal,
+}
+
+
 @overload
 async def run_converters(
     ctx: Context[BotT], converter: Union[Type[Converter[T]], Converter[T]], argument: str, param: Parameter
@@ -1612,52 +2007,16 @@ async def run_converters(ctx: Context[BotT], converter: Any, argument: str, para
     """
     origin = getattr(converter, '__origin__', None)
 
-    if origin is Union:
-        errors = []
-        _NoneType = type(None)
-        union_args = converter.__args__
-        for conv in union_args:
-            if conv is _NoneType and param.kind != param.VAR_POSITIONAL:
-                ctx.view.undo()
-                return None if param.required else await param.get_default(ctx)
-
-            try:
-                value = await run_converters(ctx, conv, argument, param)
-            except CommandError as exc:
-                errors.append(exc)
-            else:
-                return value
-
-        raise BadUnionArgument(param, union_args, errors)
-
-    if origin is Literal:
-        errors = []
-        conversions = {}
-        literal_args = converter.__args__
+    handler = _ORIGIN_HANDLERS.get(origin)
+    if handler is not None:
+        return await handler(ctx, converter, argument, param)
 
-        for literal in literal_args:
-            literal_type = type(literal)
-            try:
-                value = conversions[literal_type]
-            except KeyError:
-                try:
-                    value = await _actual_conversion(ctx, literal_type, argument, param)
-                except CommandError as exc:
-                    errors.append(exc)
-                    conversions[literal_type] = object()
-                    continue
-                else:
-                    conversions[literal_type] = value
-
-            if isinstance(value, str) and isinstance(literal, str):
-                if value.lower() == literal.lower():
-                    return literal
-            elif value == literal:
-                return value
-
-        raise BadLiteralArgument(param, literal_args, errors, argument)
-
-    if origin and is_generic_type(converter):
-        converter = CONVERTER_MAPPING.get(converter, origin)
+    if origin:
+        try:
+            generic_origin = _cached_generic_origin(converter)
+        except TypeError:  # unhashable converter
+            generic_origin = _generic_origin(converter)
+        if generic_origin is not None:
+            converter = CONVERTER_MAPPING.get(converter, generic_origin)
 
     return await _actual_conversion(ctx, converter, argument, param)
@@ -330,6 +330,8 @@ class Guild(Hashable):
         'max_stage_video_users',
         '_incidents_data',
         '_soundboard_sounds',
+        '_emoji_names',
+        '_sticker_names',
     )
 
     _PREMIUM_GUILD_LIMITS: ClassVar[Dict[Optional[int], _GuildLimit]] = {
@@ -350,6 +352,9 @@ class Guild(Hashable):
         self._soundboard_sounds: Dict[int, SoundboardSound] = {}
         self._state: ConnectionState = state
         self._member_count: Optional[int] = None
+        # (tuple, index) pairs, the index is rebuilt once the emojis or stickers tuple is replaced
+        self._emoji_names: Optional[Tuple[Tuple[Emoji, ...], Dict[str, Emoji]]] = None
+        self._sticker_names: Optional[Tuple[Tuple[GuildSticker, ...], Dict[str, GuildSticker]]] = None
         self._from_data(data)
 
     def _add_channel(self, channel: GuildChannel, /) -> None:
@@ -552,9 +557,11 @@ class Guild(Hashable):
                 self._stage_instances[stage_instance.id] = stage_instance
 
         if 'guild_scheduled_events' in guild:
+            scheduled_event_guilds = self._state._scheduled_event_guilds
             for s in guild['guild_scheduled_events']:
                 scheduled_event = ScheduledEvent(data=s, state=self._state)
                 self._scheduled_events[scheduled_event.id] = scheduled_event
+                scheduled_event_guilds[scheduled_event.id] = self.id
 
         if 'soundboard_sounds' in guild:
             for s in guild['soundboard_sounds']:
@@ -776,6 +783,26 @@ class Guild(Hashable):
             return emoji
         return None
 
+    def _get_emoji_named(self, name: str, /) -> Optional[Emoji]:
+        emojis = self.emojis
+        cached = self._emoji_names
+        if cached is None or cached[0] is not emojis:
+            index: Dict[str, Emoji] = {}
+            for emoji in emojis:
+                index.setdefault(emoji.name, emoji)
+            self._emoji_names = cached = (emojis, index)
+        return cached[1].get(name)
+
+    def _get_sticker_named(self, name: str, /) -> Optional[GuildSticker]:
+        stickers = self.stickers
+        cached = self._sticker_names
+        if cached is None or cached[0] is not stickers:
+            index: Dict[str, GuildSticker] = {}
+            for sticker in stickers:
+                index.setdefault(sticker.name, sticker)
+            self._sticker_names = cached = (stickers, index)
+        return cached[1].get(name)
+
     @property
     def afk_channel(self) -> Optional[VocalGuildChannel]:
         """Optional[Union[:class:`VoiceChannel`, :class:`StageChannel`]]: The channel that denotes the AFK channel.
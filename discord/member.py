@@ -512,6 +512,8 @@ class Member(discord.abc.Messageable, _UserTag):
                 user.get('public_flags', 0),
                 decoration_payload,
             )
+            if original[0] != modified[0] or original[3] != modified[3]:
+                self._state._user_renamed()
             # Signal to dispatch on_user_update
             return to_return, u
 
@@ -292,9 +292,13 @@ class ConnectionState(Generic[ClientT]):
     def clear(self, *, views: bool = True) -> None:
         self.user: Optional[ClientUser] = None
         self._users: weakref.WeakValueDictionary[int, User] = weakref.WeakValueDictionary()
+        # user name and global name -> ID of the first cached user with it, built on first use
+        self._user_name_index: Optional[Dict[str, int]] = None
         self._emojis: Dict[int, Emoji] = {}
         self._stickers: Dict[int, GuildSticker] = {}
         self._guilds: Dict[int, Guild] = {}
+        # scheduled event ID -> guild ID, the guild's own cache stays authoritative
+        self._scheduled_event_guilds: Dict[int, int] = {}
         if views:
             self._view_store: ViewStore = ViewStore(self)
 
@@ -385,6 +389,12 @@ class ConnectionState(Generic[ClientT]):
             user = User(state=self, data=data)
             if cache:
                 self._users[user_id] = user
+                index = self._user_name_index
+                if index is not None:
+                    # new users go to the end of the cache, so earlier users keep their names
+                    index.setdefault(user.name, user_id)
+                    if user.global_name is not None:
+                        index.setdefault(user.global_name, user_id)
             return user
 
     def store_user_no_intents(self, data: Union[UserPayload, PartialUserPayload], *, cache: bool = True) -> User:
@@ -396,6 +406,37 @@ class ConnectionState(Generic[ClientT]):
     def get_user(self, id: int) -> Optional[User]:
         return self._users.get(id)
 
+    def _get_user_named(self, name: str, /) -> Optional[User]:
+        # The first cached user whose name or global name matches, same as scanning self._users
+        users = self._users
+        index = self._user_name_index
+        if index is None:
+            index = self._user_name_index = {}
+            for user in users.values():
+                index.setdefault(user.name, user.id)
+                if user.global_name is not None:
+                    index.setdefault(user.global_name, user.id)
+
+        user_id = index.get(name)
+        if user_id is None:
+            return None
+
+        user = users.get(user_id)
+        if user is not None and (user.name == name or user.global_name == name):
+            return user
+
+        # The indexed user has since left the cache, another one may still have the name
+        user = utils.find(lambda u: u.name == name or u.global_name == name, users.values())
+        if user is None:
+            del index[name]
+        else:
+            index[name] = user.id
+        return user
+
+    def _user_renamed(self) -> None:
+        # A rename can hand a name to a user earlier in the cache, rebuild on next use
+        self._user_name_index = None
+
     def store_emoji(self, guild: Guild, data: EmojiPayload) -> Emoji:
         # the id will be present here
         emoji_id = int(data['id'])  # type: ignore
@@ -448,6 +489,9 @@ class ConnectionState(Generic[ClientT]):
         for sticker in guild.stickers:
             self._stickers.pop(sticker.id, None)
 
+        for scheduled_event_id in guild._scheduled_events:
+            self._scheduled_event_guilds.pop(scheduled_event_id, None)
+
         del guild
 
     @property
@@ -474,6 +518,10 @@ class ConnectionState(Generic[ClientT]):
         # the keys of self._stickers are ints
         return self._stickers.get(sticker_id)  # type: ignore
 
+    def _get_scheduled_event(self, scheduled_event_id: int) -> Optional[ScheduledEvent]:
+        guild = self._get_guild(self._scheduled_event_guilds.get(scheduled_event_id))
+        return guild and guild.get_scheduled_event(scheduled_event_id)
+
     @property
     def private_channels(self) -> Sequence[PrivateChannel]:
         return utils.SequenceProxy(self._private_channels.values())
@@ -826,6 +874,7 @@ class ConnectionState(Generic[ClientT]):
     def parse_user_update(self, data: gw.UserUpdateEvent) -> None:
         if self.user:
             self.user._update(data)
+            self._user_renamed()
 
     def parse_invite_create(self, data: gw.InviteCreateEvent) -> None:
         invite = Invite.from_gateway(state=self, data=data)
@@ -848,6 +897,7 @@ class ConnectionState(Generic[ClientT]):
                     for s in guild.scheduled_events:
                         if s.channel_id == channel.id:
                             guild._scheduled_events.pop(s.id)
+                            self._scheduled_event_guilds.pop(s.id, None)
                             self.dispatch('scheduled_event_delete', s)
 
                 threads = guild._remove_threads_by_channel(channel_id)
@@ -1499,6 +1549,7 @@ class ConnectionState(Generic[ClientT]):
         if guild is not None:
             scheduled_event = ScheduledEvent(state=self, data=data)
             guild._scheduled_events[scheduled_event.id] = scheduled_event
+            self._scheduled_event_guilds[scheduled_event.id] = guild.id
             self.dispatch('scheduled_event_create', scheduled_event)
         else:
             _log.debug('SCHEDULED_EVENT_CREATE referencing unknown guild ID: %s. Discarding.', data['guild_id'])
@@ -1524,6 +1575,7 @@ class ConnectionState(Generic[ClientT]):
             except KeyError:
                 pass
             else:
+                self._scheduled_event_guilds.pop(scheduled_event.id, None)
                 self.dispatch('scheduled_event_delete', scheduled_event)
         else:
             _log.debug('SCHEDULED_EVENT_DELETE referencing unknown guild ID: %s. Discarding.', data['guild_id'])
@@ -1922,6 +1974,7 @@ class AutoShardedConnectionState(ConnectionState[ClientT]):
         self.user = user = ClientUser(state=self, data=data['user'])
         # self._users is a list of Users, we're setting a ClientUser
         self._users[user.id] = user  # type: ignore
+        self._user_renamed()
 
         if self.application_id is None:
             try:
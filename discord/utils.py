@@ -957,6 +957,9 @@ _URL_REGEX = r'(?P<url><[^: >]+:\/[^ >]+>|(?:https?|steam):\/\/[^\s<]+[^<.,:;\"\
 
 _MARKDOWN_STOCK_REGEX = fr'(?P<markdown>[_\\~|\*`]|{_MARKDOWN_ESCAPE_COMMON})'
 
+# Every markdown match above starts with one of these, text without any of them is left as is
+_MARKDOWN_CHARS = frozenset('_\\~|*`>[#-')
+
 
 def remove_markdown(text: str, *, ignore_links: bool = True) -> str:
     """A helper function that removes markdown characters.
@@ -982,6 +985,9 @@ def remove_markdown(text: str, *, ignore_links: bool = True) -> str:
         The text with the markdown special characters removed.
     """
 
+    if _MARKDOWN_CHARS.isdisjoint(text):
+        return text
+
     def replacement(match: re.Match[str]) -> str:
         groupdict = match.groupdict()
         return groupdict.get('url', '')
@@ -1017,6 +1023,9 @@ def escape_markdown(text: str, *, as_needed: bool = False, ignore_links: bool =
         The text with the markdown special characters escaped with a slash.
     """
 
+    if _MARKDOWN_CHARS.isdisjoint(text):
+        return text
+
     if not as_needed:
 
         def replacement(match):
@@ -1058,6 +1067,8 @@ def escape_mentions(text: str) -> str:
     :class:`str`
         The text with the mentions removed.
     """
+    if '@' not in text:
+        return text
     return re.sub(r'@(everyone|here|[!&]?[0-9]{17,20})', '@\u200b\\1', text)
 
 
@@ -0,0 +1,132 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-present Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import copy
+import pickle
+
+import discord
+import pytest
+
+
+@pytest.mark.parametrize(
+    ('name', 'is_custom_emoji'),
+    [
+        ('\N{THUMBS UP SIGN}', False),
+        ('blobcat', True),
+    ],
+)
+def test_basic_emoji_kind(name, is_custom_emoji):
+    emoji = discord.BasicEmoji(name, is_custom_emoji=is_custom_emoji)
+
+    assert isinstance(emoji, discord.BasicEmoji)
+    assert emoji.is_custom_emoji is is_custom_emoji
+    assert emoji.is_unicode_emoji is not is_custom_emoji
+    assert str(emoji) == name
+    assert repr(emoji) == f'<BasicEmoji name={name!r}>'
+
+
+def test_basic_emoji_equality():
+    a = discord.BasicEmoji('\N{THUMBS UP SIGN}')
+    b = discord.BasicEmoji('\N{THUMBS UP SIGN}')
+    c = discord.BasicEmoji('\N{THUMBS DOWN SIGN}')
+
+    assert a == b
+    assert not a != b
+    assert a != c
+    assert a != '\N{THUMBS UP SIGN}'
+    assert hash(a) == hash(b)
+    assert len({a, b, c}) == 2
+
+
+def test_basic_emoji_get_is_shared():
+    a = discord.BasicEmoji.get('blobcat', is_custom_emoji=True)
+
+    assert discord.BasicEmoji.get('blobcat', is_custom_emoji=True) is a
+    assert discord.BasicEmoji.get('blobcat') is not a
+    assert a.is_custom_emoji
+
+
+def test_basic_emoji_name_not_interned():
+    class Name(str):
+        pass
+
+    name = Name('blobcat')
+    emoji = discord.BasicEmoji(name, is_custom_emoji=True)
+    assert emoji.name is name
+    assert emoji == discord.BasicEmoji('blobcat', is_custom_emoji=True)
+
+    assert discord.BasicEmoji(None).name is None  # type: ignore
+
+
+@pytest.mark.parametrize('is_custom_emoji', [False, True])
+def test_basic_emoji_copy_and_pickle(is_custom_emoji):
+    emoji = discord.BasicEmoji('blobcat', is_custom_emoji=is_custom_emoji)
+
+    for clone in (copy.copy(emoji), copy.deepcopy(emoji), pickle.loads(pickle.dumps(emoji))):
+        assert clone == emoji
+        assert type(clone) is type(emoji)
+        assert clone.is_custom_emoji is is_custom_emoji
+        assert hash(clone) == hash(emoji)
+
+
+def test_basic_emoji_name_is_read_only():
+    emoji = discord.BasicEmoji('\N{THUMBS UP SIGN}')
+
+    with pytest.raises(AttributeError):
+        emoji.name = '\N{THUMBS DOWN SIGN}'  # type: ignore
+
+    assert emoji.name == '\N{THUMBS UP SIGN}'
+    assert hash(emoji) == hash(discord.BasicEmoji('\N{THUMBS UP SIGN}'))
+    # the cached repr can only go stale if the name changes
+    assert repr(emoji) == repr(discord.BasicEmoji('\N{THUMBS UP SIGN}'))
+
+
+def test_basic_emoji_get_per_class():
+    class Sub(discord.BasicEmoji):
+        __slots__ = ()
+
+    shared = discord.BasicEmoji.get('\N{THUMBS UP SIGN}')
+    sub = Sub.get('\N{THUMBS UP SIGN}')
+
+    assert type(sub) is Sub
+    assert Sub.get('\N{THUMBS UP SIGN}') is sub
+    assert discord.BasicEmoji.get('\N{THUMBS UP SIGN}') is shared
+
+    with pytest.raises(AttributeError):
+        shared.name = '\N{THUMBS DOWN SIGN}'  # type: ignore
+    assert discord.BasicEmoji.get('\N{THUMBS UP SIGN}').name == '\N{THUMBS UP SIGN}'
+
+
+@pytest.mark.parametrize('is_custom_emoji', [False, True])
+def test_basic_emoji_subclass(is_custom_emoji):
+    class Sub(discord.BasicEmoji):
+        __slots__ = ()
+
+    emoji = Sub('blobcat', is_custom_emoji=is_custom_emoji)
+
+    assert type(emoji) is Sub
+    assert emoji.is_custom_emoji is is_custom_emoji
+    assert emoji.is_unicode_emoji is not is_custom_emoji
@@ -0,0 +1,517 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2015-present Rapptz
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Dict, List, Literal, Union
+
+import discord
+from discord.ext import commands
+from discord.ext.commands import converter
+from discord.state import ConnectionState
+import pytest
+
+
+@pytest.mark.parametrize(
+    ('s1', 's2', 'expected'),
+    [
+        ('', '', 0),
+        ('', 'abc', 3),
+        ('abc', '', 3),
+        ('abc', 'abc', 0),
+        ('kitten', 'sitting', 3),
+        ('sitting', 'kitten', 3),
+        ('flaw', 'lawn', 2),
+        ('moderator', 'mod', 6),
+    ],
+)
+def test_levenshtein_distance(s1, s2, expected):
+    assert converter._levenshtein_distance(s1, s2) == expected
+    assert commands.RoleConverter().levenshtein_distance(s1, s2) == expected
+
+
+@pytest.mark.parametrize(('cutoff', 'expected'), [(0, 1), (2, 3), (3, 3), (10, 3)])
+def test_levenshtein_distance_cutoff(cutoff, expected):
+    assert converter._levenshtein_distance('kitten', 'sitting', cutoff) == expected
+
+
+class _FakeLevenshtein:
+    # Stands in for rapidfuzz.distance.Levenshtein, with its score_cutoff semantics
+    @staticmethod
+    def distance(s1, s2, *, score_cutoff=None):
+        previous_row = list(range(len(s2) + 1))
+        for i, c1 in enumerate(s1, 1):
+            current_row = [i]
+            for j, c2 in enumerate(s2):
+                current_row.append(min(previous_row[j + 1] + 1, current_row[j] + 1, previous_row[j] + (c1 != c2)))
+            previous_row = current_row
+        distance = previous_row[-1]
+        if score_cutoff is not None and distance > score_cutoff:
+            return score_cutoff + 1
+        return distance
+
+
+@pytest.mark.parametrize('cutoff', [None, 0, 1, 2, 3, 10])
+@pytest.mark.parametrize(
+    ('s1', 's2'), [('', ''), ('', 'abc'), ('kitten', 'sitting'), ('flaw', 'lawn'), ('moderator', 'mod'), ('abc', 'abc')]
+)
+def test_levenshtein_distance_rapidfuzz(monkeypatch, s1, s2, cutoff):
+    monkeypatch.setattr(converter, '_HAS_RAPIDFUZZ', True)
+    monkeypatch.setattr(converter, '_Levenshtein', _FakeLevenshtein, raising=False)
+
+    expected = converter._levenshtein_distance(s1, s2, cutoff)
+    assert commands.RoleConverter().levenshtein_distance(s1, s2, cutoff) == expected
+
+
+def _roles(*names):
+    return [SimpleNamespace(name=name) for name in names]
+
+
+def test_role_fuzzy_search():
+    roles = _roles('Admin', 'Moderator', 'Server Booster', 'Members')
+    search = commands.RoleConverter().fuzzy_search
+
+    assert search('admin', roles) is roles[0]
+    assert search('mod', roles) is roles[1]
+    assert search('booster', roles) is roles[2]
+    assert search('Memebrs', roles) is roles[3]
+    assert search('anything', []) is None
+
+
+def test_role_fuzzy_search_scoring_hooks():
+    class ReverseScoring(commands.RoleConverter):
+        def word_match_score(self, query, choice):
+            return 0
+
+        def normalized_levenshtein(self, s1, s2):
+            # prefer the least similar role
+            return -super().normalized_levenshtein(s1, s2)
+
+    roles = _roles('Members', 'Admin')
+    assert commands.RoleConverter().fuzzy_search('Memebrs', roles) is roles[0]
+    assert ReverseScoring().fuzzy_search('Memebrs', roles) is roles[1]
+    # substring matches still win before any scoring
+    assert ReverseScoring().fuzzy_search('member', roles) is roles[0]
+
+
+@pytest.mark.parametrize(
+    ('argument', 'expected'),
+    [
+        ('#ABCDEF', discord.Colour(0xABCDEF)),
+        ('0xfff', discord.Colour(0xFFFFFF)),
+        ('rgb(68,36,59)', discord.Colour(0x44243B)),
+        ('RGB(68,36,59)', discord.Colour(0x44243B)),
+        ('red', discord.Colour.red()),
+        ('Dark Theme', discord.Colour.dark_theme()),
+        ('dark_grey', discord.Colour.dark_grey()),
+    ],
+)
+@pytest.mark.asyncio
+async def test_colour_converter(argument, expected):
+    assert await commands.ColourConverter().convert(None, argument) == expected  # type: ignore
+
+
+@pytest.mark.parametrize('argument', ['not a colour', 'from_rgb', 'from_str', '#nope', 'rgb(1, 2)', 'random_'])
+@pytest.mark.asyncio
+async def test_colour_converter_failure(argument):
+    with pytest.raises(commands.BadColourArgument):
+        await commands.ColourConverter().convert(None, argument)  # type: ignore
+
+
+@pytest.mark.parametrize(
+    ('argument', 'seconds'),
+    [
+        ('10s', 10),
+        ('1h 30m', 5400),
+        ('1.5 hours', 5400),
+        ('2 Days', 172800),
+        ('1w1d', 691200),
+    ],
+)
+@pytest.mark.asyncio
+async def test_timedelta_converter(argument, seconds):
+    result = await converter.TimeDeltaConverter().convert(None, argument)  # type: ignore
+    assert result.total_seconds() == seconds
+
+
+@pytest.mark.parametrize('argument', ['soon', '10 fortnights'])
+@pytest.mark.asyncio
+async def test_timedelta_converter_failure(argument):
+    with pytest.raises(commands.BadArgument):
+        await converter.TimeDeltaConverter().convert(None, argument)  # type: ignore
+
+
+@pytest.mark.parametrize(
+    'argument', ['123456789012345678', '<:blob:123456789012345678>', '<a:blob:123456789012345678>', 'blob']
+)
+@pytest.mark.asyncio
+async def test_emoji_converter(argument):
+    emoji = SimpleNamespace(id=123456789012345678, name='blob')
+    bot = SimpleNamespace(emojis=[emoji], get_emoji=lambda id: emoji if id == emoji.id else None)
+    ctx = SimpleNamespace(guild=None, bot=bot)
+
+    assert await commands.EmojiConverter().convert(ctx, argument) is emoji  # type: ignore
+
+
+@pytest.mark.parametrize('argument', ['\N{THUMBS UP SIGN}', '\N{COPYRIGHT SIGN}', '#\N{COMBINING ENCLOSING KEYCAP}'])
+@pytest.mark.asyncio
+async def test_basic_emoji_converter_unicode(argument):
+    ctx = SimpleNamespace(guild=None, bot=SimpleNamespace(emojis=[]))
+    result = await converter.BasicEmojiConverter().convert(ctx, argument)  # type: ignore
+    assert result == discord.BasicEmoji(argument)
+    assert result.is_unicode_emoji
+
+
+@pytest.mark.parametrize('argument', ['', 'thumbsup', '#general', '1'])
+@pytest.mark.asyncio
+async def test_basic_emoji_converter_failure(argument):
+    ctx = SimpleNamespace(guild=None, bot=SimpleNamespace(emojis=[]))
+    with pytest.raises(converter.BasicEmojiConversionFailure):
+        await converter.BasicEmojiConverter().convert(ctx, argument)  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_roles_converter():
+    roles = _roles('Admin', 'Moderator', 'Members')
+    roles[1].id = 123456789012345678
+    guild = SimpleNamespace(roles=roles, get_role=lambda id: roles[1] if id == roles[1].id else None)
+    ctx = SimpleNamespace(guild=guild)
+
+    result = await converter.RolesConverter().convert(ctx, 'admin, <@&123456789012345678>, members, admin')  # type: ignore
+    assert result == [roles[0], roles[1], roles[2], roles[0]]
+
+    with pytest.raises(commands.NoPrivateMessage):
+        await converter.RolesConverter().convert(SimpleNamespace(guild=None), 'admin')  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_clean_content_private():
+    user = SimpleNamespace(id=123456789012345678, display_name='Danny')
+    ctx = SimpleNamespace(
+        guild=None,
+        message=SimpleNamespace(mentions=[user], role_mentions=[]),
+        bot=SimpleNamespace(get_user=lambda id: None),
+    )
+    argument = 'hi <@123456789012345678> <@!123456789012345678> <@&234567890123456789> <#345678901234567890> <@456789012345678901>'
+
+    result = await commands.clean_content().convert(ctx, argument)  # type: ignore
+    assert result == 'hi @Danny @Danny @deleted-role <#345678901234567890> @deleted-user'
+
+
+class _Upper(commands.Converter[str]):
+    async def convert(self, ctx, argument):
+        return argument.upper()
+
+
+class _ClassUpper(commands.Converter[str]):
+    @classmethod
+    async def convert(cls, ctx, argument):
+        return argument.upper()
+
+
+class _UnhashableUpper(_Upper):
+    __hash__ = None  # type: ignore
+
+
+@pytest.mark.parametrize('conv', [_Upper, _Upper(), _ClassUpper, _UnhashableUpper(), str.upper])
+@pytest.mark.asyncio
+async def test_actual_conversion_kinds(conv):
+    param = commands.parameter()
+    for _ in range(2):
+        assert await converter._actual_conversion(None, conv, 'abc', param) == 'ABC'  # type: ignore
+
+
+def test_special_converters_memoized():
+    assert commands.Greedy[int] is commands.Greedy[int]
+    assert commands.Range[int, 1, 10] is commands.Range[int, 1, 10]
+    assert commands.Range[int, 1, 10] is not commands.Range[int, 1, 11]
+    # Equal but differently typed bounds are still validated rather than served from the cache
+    with pytest.raises(TypeError):
+        commands.Range[int, 1, 10.0]
+    with pytest.raises(TypeError):
+        commands.Range[int, True, 10]
+
+    assert commands.Greedy[Union[int, float]].converter.__args__ == (int, float)
+    assert commands.Greedy[Union[float, int]].converter.__args__ == (float, int)
+
+    with pytest.raises(TypeError):
+        commands.Greedy[str]
+
+
+def test_guild_emoji_named():
+    first, duplicate, other = (SimpleNamespace(name=name) for name in ('blob', 'blob', 'wave'))
+    guild = SimpleNamespace(emojis=(first, duplicate), _emoji_names=None)
+
+    assert discord.Guild._get_emoji_named(guild, 'blob') is first  # type: ignore
+    assert discord.Guild._get_emoji_named(guild, 'wave') is None  # type: ignore
+
+    guild.emojis = (other,)
+    assert discord.Guild._get_emoji_named(guild, 'wave') is other  # type: ignore
+    assert discord.Guild._get_emoji_named(guild, 'blob') is None  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_scheduled_event_converter_private():
+    from discord.state import ConnectionState
+
+    event = SimpleNamespace(id=123456789012345678, guild_id=2)
+    guild = SimpleNamespace(get_scheduled_event=lambda id: event if id == event.id else None)
+    state = SimpleNamespace(_scheduled_event_guilds={event.id: 2}, _get_guild=lambda id: guild if id == 2 else None)
+    state._get_scheduled_event = lambda id: ConnectionState._get_scheduled_event(state, id)  # type: ignore
+    ctx = SimpleNamespace(guild=None, bot=SimpleNamespace(_connection=state))
+
+    assert await converter.ScheduledEventConverter().convert(ctx, str(event.id)) is event  # type: ignore
+
+    state._scheduled_event_guilds[234567890123456789] = 3
+    with pytest.raises(commands.ScheduledEventNotFound):
+        await converter.ScheduledEventConverter().convert(ctx, '234567890123456789')  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_range_convert():
+    ctx = SimpleNamespace(current_parameter=commands.parameter())
+
+    assert await commands.Range[int, 1, 10].convert(ctx, '5') == 5  # type: ignore
+    assert await commands.Range[float, None, 1.5].convert(ctx, '1.5') == 1.5  # type: ignore
+    assert await commands.Range[str, 2, 3].convert(ctx, 'abc') == 'abc'  # type: ignore
+
+    with pytest.raises(commands.RangeError):
+        await commands.Range[int, 1, 10].convert(ctx, '11')  # type: ignore
+    with pytest.raises(commands.RangeError):
+        await commands.Range[str, 2, 3].convert(ctx, 'a')  # type: ignore
+    with pytest.raises(commands.BadArgument):
+        await commands.Range[int, 1, 10].convert(ctx, 'five')  # type: ignore
+
+
+@pytest.mark.parametrize(
+    ('argument', 'expected'), [('yes', True), ('ON', True), ('1', True), ('No', False), ('disable', False), ('0', False)]
+)
+def test_convert_to_bool(argument, expected):
+    assert converter._convert_to_bool(argument) is expected
+
+
+def test_convert_to_bool_failure():
+    with pytest.raises(commands.BadBoolArgument):
+        converter._convert_to_bool('maybe')
+
+
+@pytest.mark.parametrize(
+    ('annotation', 'argument', 'expected'),
+    [
+        (Union[int, float], '1', 1),
+        (Union[float, int], '1', 1.0),
+        (Union[int, float], '1.5', 1.5),
+        (Union[Literal['all'], int], 'ALL', 'all'),
+        (Union[Literal['all'], int], '3', 3),
+        (Union[Literal[1, 2], int], '5', 5),
+        (Union[Literal[1, 2], Literal['x'], int], 'X', 'x'),
+    ],
+)
+@pytest.mark.asyncio
+async def test_run_converters_union(annotation, argument, expected):
+    param = commands.Parameter('value', commands.Parameter.POSITIONAL_OR_KEYWORD)
+    result = await commands.run_converters(None, annotation, argument, param)  # type: ignore
+    assert result == expected
+    assert type(result) is type(expected)
+
+
+@pytest.mark.asyncio
+async def test_run_converters_union_equal_literal_arms():
+    # Literal[1, '1'] == Literal['1', 1], each Union must still use its own arm
+    param = commands.Parameter('value', commands.Parameter.POSITIONAL_OR_KEYWORD)
+    first = SimpleNamespace(__args__=(Literal[1, '1'], float))
+    second = SimpleNamespace(__args__=(Literal['1', 1], float))
+    assert first.__args__ == second.__args__
+
+    assert await converter._convert_union(None, first, '1', param) == 1  # type: ignore
+    result = await converter._convert_union(None, second, '1', param)  # type: ignore
+    assert result == '1'
+    assert type(result) is str
+
+
+@pytest.mark.asyncio
+async def test_run_converters_union_reuses_literal_conversion():
+    calls = []
+
+    class Counted(int):
+        def __new__(cls, argument):
+            calls.append(argument)
+            return super().__new__(cls, argument)
+
+    annotation = Union[Literal[Counted(1)], Counted]
+    calls.clear()
+
+    param = commands.Parameter('value', commands.Parameter.POSITIONAL_OR_KEYWORD)
+    assert await commands.run_converters(None, annotation, '5', param) == 5  # type: ignore
+    assert calls == ['5']
+
+
+@pytest.mark.asyncio
+async def test_run_converters_union_failure():
+    param = commands.Parameter('value', commands.Parameter.POSITIONAL_OR_KEYWORD)
+    with pytest.raises(commands.BadUnionArgument) as excinfo:
+        await commands.run_converters(None, Union[int, float], 'abc', param)  # type: ignore
+    assert len(excinfo.value.errors) == 2
+
+
+def test_generic_origin():
+    assert converter._cached_generic_origin(List[int]) is list
+    assert converter._cached_generic_origin(Dict[str, int]) is dict
+    assert converter._cached_generic_origin(int) is None
+
+
+@pytest.mark.asyncio
+async def test_run_converters_generic_mapping_is_live(monkeypatch):
+    class Upper(commands.Converter):
+        async def convert(self, ctx, argument):
+            return argument.upper()
+
+    param = commands.Parameter('value', commands.Parameter.POSITIONAL_OR_KEYWORD)
+    assert await commands.run_converters(None, List[str], 'ab', param) == ['a', 'b']  # type: ignore
+
+    monkeypatch.setitem(converter.CONVERTER_MAPPING, List[str], Upper)
+    assert await commands.run_converters(None, List[str], 'ab', param) == 'AB'  # type: ignore
+
+
+@pytest.mark.parametrize(
+    ('annotation', 'argument', 'expected'),
+    [
+        (Literal['yes', 'no'], 'YES', 'yes'),
+        (Literal['a', 'A'], 'A', 'a'),
+        (Literal['A', 'a'], 'a', 'A'),
+        (Literal[1, 2], '2', 2),
+        (Literal[1, '1'], '1', 1),
+        (Literal['1', 1], '1', '1'),
+        (Literal[True], 'on', True),
+        (Literal[1.5, 'x'], 'X', 'x'),
+        (Literal['strasse'], 'STRAßE', 'strasse'),
+        (Literal['straße'], 'STRASSE', 'straße'),
+        (Literal['ab', 'abc'], 'ABC', 'abc'),
+        (Literal['a', 'b', 'c', 'd'], 'D', 'd'),
+        (Literal[1, 2, 3], '3', 3),
+    ],
+)
+@pytest.mark.asyncio
+async def test_run_converters_literal(annotation, argument, expected):
+    param = commands.Parameter('value', commands.Parameter.POSITIONAL_OR_KEYWORD)
+    result = await commands.run_converters(None, annotation, argument, param)  # type: ignore
+    assert result == expected
+    assert type(result) is type(expected)
+
+
+@pytest.mark.asyncio
+async def test_run_converters_literal_str_skips_conversion(monkeypatch):
+    async def fail(*args):
+        raise AssertionError('str literals should not be converted')
+
+    monkeypatch.setattr(converter, '_actual_conversion', fail)
+    param = commands.Parameter('value', commands.Parameter.POSITIONAL_OR_KEYWORD)
+    assert await commands.run_converters(None, Literal['on', 'off'], 'OFF', param) == 'off'  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_run_converters_literal_failed_type():
+    param = commands.Parameter('value', commands.Parameter.POSITIONAL_OR_KEYWORD)
+    assert await commands.run_converters(None, Literal[1, 'x', 2], 'X', param) == 'x'  # type: ignore
+
+    with pytest.raises(commands.BadLiteralArgument) as excinfo:
+        await commands.run_converters(None, Literal[1, 'x', 2], 'y', param)  # type: ignore
+    assert len(excinfo.value.errors) == 1
+
+
+def test_literal_descriptor_lookup():
+    descriptor = converter._LiteralDescriptor(('a', 'A', 'b'))
+    assert descriptor.folded_lookup == {'a': 'a', 'b': 'b'}
+    assert descriptor.value_lookup is None
+
+    descriptor = converter._LiteralDescriptor((1, 2))
+    assert descriptor.folded_lookup is None
+    assert descriptor.value_lookup == {1, 2}
+
+    descriptor = converter._LiteralDescriptor((1, '1', True, 2))
+    assert descriptor.types == (int, str, bool)
+    assert [index for _, index, _ in descriptor.entries] == [0, 1, 2, 0]
+    assert descriptor.folded_lookup is None
+    assert descriptor.value_lookup is None
+
+
+@pytest.mark.parametrize(
+    ('annotation', 'argument'), [(Literal['yes', 'no'], 'maybe'), (Literal[1, 2], 'one'), (Literal[1, 2], '3')]
+)
+@pytest.mark.asyncio
+async def test_run_converters_literal_failure(annotation, argument):
+    param = commands.Parameter('value', commands.Parameter.POSITIONAL_OR_KEYWORD)
+    with pytest.raises(commands.BadLiteralArgument):
+        await commands.run_converters(None, annotation, argument, param)  # type: ignore
+
+
+class _UserState:
+    _get_user_named = ConnectionState._get_user_named
+    _user_renamed = ConnectionState._user_renamed
+    store_user = ConnectionState.store_user
+
+    def __init__(self, users):
+        self._users = {user.id: user for user in users}
+        self._user_name_index = None
+
+
+def test_get_user_named():
+    alice = SimpleNamespace(id=1, name='alice', global_name='Alice', discriminator='0')
+    bob = SimpleNamespace(id=2, name='bob', global_name=None, discriminator='1234')
+    state = _UserState([alice, bob])
+
+    assert converter._get_user_named(state, 'alice') is alice  # type: ignore
+    assert converter._get_user_named(state, 'Alice') is alice  # type: ignore
+    assert converter._get_user_named(state, 'bob#1234') is bob  # type: ignore
+    index = state._user_name_index
+    assert converter._get_user_named(state, 'carol') is None  # type: ignore
+    # A miss that no user matches leaves the index alone
+    assert state._user_name_index is index
+
+    # Renames are reported by the user update paths
+    alice.name = 'carol'
+    state._user_renamed()
+    assert converter._get_user_named(state, 'carol') is alice  # type: ignore
+    assert converter._get_user_named(state, 'alice') is None  # type: ignore
+
+
+def test_get_user_named_shared_name():
+    # The first cached user with the name wins, whether by name or global name
+    first = SimpleNamespace(id=1, name='first', global_name='sam', discriminator='0')
+    second = SimpleNamespace(id=2, name='sam', global_name=None, discriminator='0')
+    state = _UserState([first, second])
+    assert converter._get_user_named(state, 'sam') is first  # type: ignore
+
+    # Users cached later don't take a name over
+    third = state.store_user({'id': '3', 'username': 'sam', 'discriminator': '0', 'avatar': None})
+    assert state._users[3] is third
+    assert converter._get_user_named(state, 'sam') is first  # type: ignore
+
+    # Once the first user leaves the cache the next one in order is found
+    del state._users[first.id]
+    assert converter._get_user_named(state, 'sam') is second  # type: ignore
+    del state._users[second.id]
+    assert converter._get_user_named(state, 'sam') is third  # type: ignore
@@ -172,6 +172,26 @@ def test_escape_mentions(mention):
     assert mention not in utils.escape_mentions(f"one {mention} two")
 
 
+@pytest.mark.parametrize(
+    ('text', 'escaped', 'removed'),
+    [
+        ('plain text', 'plain text', 'plain text'),
+        ('see https://example.com/a?b=c', 'see https://example.com/a?b=c', 'see https://example.com/a?b=c'),
+        ('**bold** and _it_', '\\*\\*bold\\*\\* and \\_it\\_', 'bold and it'),
+        ('https://example.com/a_b_c', 'https://example.com/a_b_c', 'https://example.com/a_b_c'),
+        ('> quote', '\\> quote', 'quote'),
+    ],
+)
+def test_markdown_helpers(text, escaped, removed):
+    assert utils.escape_markdown(text) == escaped
+    assert utils.remove_markdown(text) == removed
+
+
+@pytest.mark.parametrize('text', ['', 'no mentions here', 'user@example.com', '<#381978264698224660>'])
+def test_escape_mentions_unchanged(text):
+    assert utils.escape_mentions(text) == text
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     ('source', 'chunk_size', 'chunked'),